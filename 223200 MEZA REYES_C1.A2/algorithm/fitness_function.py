@@ -1,8 +1,14 @@
-import math
+import numpy as np
+
+def fitness_expression(x):
+    magnitude = np.abs(x ** 3)
+    return np.log(magnitude + (magnitude == 0)) * np.cos(x) * np.sin(x)
 
 class FitnessFunction:
+    expression = staticmethod(fitness_expression)
+
     def calculate(self, x):
-        return math.log(abs(x**3)) * math.cos(x) * math.sin(x)
+        return float(self.expression(x))
 
     #def calculate(self, x):
     #    return 0.1 * x * math.log(1 + abs(x)) * math.cos(x) ** 2
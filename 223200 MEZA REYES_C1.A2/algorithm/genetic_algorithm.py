@@ -1,9 +1,17 @@
 import random
 import math
+import inspect
+import hashlib
 import threading
+import itertools
 from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from utils.checkpoint import CheckpointWriter, encode_state, decode_state, read_checkpoint
+from utils.result_cache import cache_key
+from utils.adaptation import AdaptationStrategy, RateAdaptation
 from .individual import Individual
 from .fitness_function import FitnessFunction
+from .kernels import KernelBackend, GenomeKernel, create_fitness_kernel, resolve_kernel_backend
 from enum import Enum
 
 class PairingStrategy(Enum):
@@ -22,6 +30,11 @@ class PruningStrategy(Enum):
     PROPORTIONAL = "proportional"
     BEST_ONLY = "best_only"
 
+RESULT_CACHE_VERSION = 1
+EXECUTION_PARAMETERS = (
+    "self", "checkpoint_path", "checkpoint_interval", "evaluator", "memory_tracker", "result_cache",
+)
+
 class GeneticAlgorithm:
     def __init__(
         self,
@@ -37,8 +50,22 @@ class GeneticAlgorithm:
         pairing_strategy=PairingStrategy.QUARTER_ALL,
         crossover_strategy=CrossoverStrategy.COMPLETE_HYBRID,
         mutation_strategy=MutationStrategy.COMPLEMENT,
-        pruning_strategy=PruningStrategy.BEST_ONLY
+        pruning_strategy=PruningStrategy.BEST_ONLY,
+        checkpoint_path=None,
+        checkpoint_interval=0,
+        evaluator=None,
+        memory_tracker=None,
+        seed=None,
+        result_cache=None,
+        adaptation=AdaptationStrategy.FIXED,
+        target_success_rate=0.2,
+        adaptation_factor=0.85,
+        decay_final_ratio=0.1,
+        kernel_backend=KernelBackend.NUMPY
     ):
+        self.parameters = {
+            key: value for key, value in locals().items() if key not in EXECUTION_PARAMETERS
+        }
         self.delta = delta
         self.interval = [min_val, max_val]
         self.iteration = iteration
@@ -54,6 +81,15 @@ class GeneticAlgorithm:
         self.lock = threading.Lock()
         self.delta_system = (self.interval[1] - self.interval[0]) / (2**self.bits - 1)
         self.fitness_function = FitnessFunction()
+        self.evaluator = evaluator
+        self.kernel = None
+        self.genome_kernel = None
+        if kernel_backend is not None:
+            kernel_backend = resolve_kernel_backend(kernel_backend)
+            self.kernel = create_fitness_kernel(
+                kernel_backend, self.fitness_function, self.interval[0], self.delta_system, self.bits
+            )
+            self.genome_kernel = GenomeKernel(kernel_backend, self.bits)
         self.best_solution = None
         self.best_fitness = float("-inf")
         self.best_x = None
@@ -66,21 +102,35 @@ class GeneticAlgorithm:
         self.mutation_strategy = mutation_strategy
         self.pruning_strategy = pruning_strategy
 
+        self.generation = 0
+        self.fitness_history = []
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = int(checkpoint_interval)
+        self.checkpoint_writer = None
+        self.memory_tracker = memory_tracker
+        self.seed = seed
+        self.result_cache = result_cache
+        self.adaptation = RateAdaptation(
+            adaptation, crossover_rate, iteration, target_success_rate, adaptation_factor,
+            decay_final_ratio
+        )
+
     def initialize_population(self):
+        if self.seed is not None:
+            random.seed(self.seed)
+        self.population = [
+            Individual(self.bits, self.n_points) for _ in range(int(self.pop_max))
+        ]
+        self.fitness = self._evaluate_fitness(self.population)
+
+    def _evaluate_fitness(self, individuals):
+        if self.evaluator is None and self.kernel is not None:
+            return self.kernel.evaluate_genomes([ind.genome for ind in individuals]).tolist()
+        values = [self._decode_individual(ind.binary) for ind in individuals]
+        if self.evaluator is not None:
+            return list(self.evaluator.evaluate(values))
         with ThreadPoolExecutor() as executor:
-            individuals = [
-                Individual(self.bits, self.n_points) for _ in range(int(self.pop_max))
-            ]
-
-            self.population = individuals
-            self.fitness = list(
-                executor.map(
-                    lambda ind: self.fitness_function.calculate(
-                        self._decode_individual(ind.binary)
-                    ),
-                    self.population,
-                )
-            )
+            return list(executor.map(self.fitness_function.calculate, values))
 
     def _decode_individual(self, binary):
         index = int(binary, 2)
@@ -101,21 +151,21 @@ class GeneticAlgorithm:
                     self._best_only_pruning(target_size)
 
     def evolve(self, current_iteration):
-        with ThreadPoolExecutor() as executor:
-            new_population = []
-            for _ in range(len(self.population) // 2):
-                parent1, parent2 = self._select_parents()
-                child1, child2 = self._crossover(parent1, parent2)
-                new_population.extend([child1, child2])
-
-            new_fitness = list(
-                executor.map(
-                    lambda ind: self.fitness_function.calculate(
-                        self._decode_individual(ind.binary)
-                    ),
-                    new_population,
-                )
-            )
+        parent_fitness = {id(ind): fit for ind, fit in zip(self.population, self.fitness)}
+        new_population = []
+        lineage = []
+        batch = [] if self.genome_kernel is not None else None
+        for _ in range(len(self.population) // 2):
+            parent1, parent2 = self._select_parents()
+            child1, child2 = self._crossover(parent1, parent2, batch)
+            new_population.extend([child1, child2])
+            best_parent = max(parent_fitness[id(parent1)], parent_fitness[id(parent2)])
+            lineage.extend([(child1, parent1, parent2, best_parent), (child2, parent1, parent2, best_parent)])
+        if batch:
+            self._recombine_batch(batch)
+
+        new_fitness = self._evaluate_fitness(new_population)
+        self._observe_offspring(lineage, new_fitness)
 
         with self.lock:
             self._update_population(
@@ -125,6 +175,33 @@ class GeneticAlgorithm:
             self._update_best_and_worst()
 
         self.adjust_population_size(current_iteration)
+        self.generation = current_iteration + 1
+        self._record_history()
+        self.adaptation.update(
+            self.generation,
+            sum(ind.mutation_scale for ind in self.population) / len(self.population)
+        )
+
+        if self.checkpoint_interval > 0 and self.generation % self.checkpoint_interval == 0:
+            self.save_checkpoint()
+        if self.memory_tracker is not None:
+            self.memory_tracker.sample(self.generation)
+
+    def _observe_offspring(self, lineage, fitness):
+        crossed = [
+            fit > best_parent
+            for (child, parent1, parent2, best_parent), fit in zip(lineage, fitness)
+            if child is not parent1 and child is not parent2
+        ]
+        self.adaptation.observe(sum(crossed), len(crossed), crossed=True)
+
+    def _record_history(self):
+        with self.lock:
+            self.fitness_history.append((
+                max(self.fitness),
+                min(self.fitness),
+                sum(self.fitness) / len(self.fitness),
+            ))
 
     def _select_parents(self):
         if self.pairing_strategy == PairingStrategy.RANDOM:
@@ -159,20 +236,51 @@ class GeneticAlgorithm:
 
 
 
-    def _crossover(self, parent1, parent2):
-        if random.random() < self.crossover_rate:
+    def _crossover(self, parent1, parent2, batch=None):
+        if random.random() < self.adaptation.crossover_rate:
+            if batch is not None:
+                return self._planned_crossover(parent1, parent2, batch)
             if self.crossover_strategy == CrossoverStrategy.SINGLE_POINT:
                 return self._single_point_crossover(parent1, parent2)
             elif self.crossover_strategy == CrossoverStrategy.COMPLETE_HYBRID:
                 return self._complete_hybrid_crossover(parent1, parent2)
         return parent1, parent2
 
+    def _planned_crossover(self, parent1, parent2, batch):
+        if self.crossover_strategy == CrossoverStrategy.SINGLE_POINT:
+            mask = self.genome_kernel.single_point_mask(random.randint(1, self.bits - 1))
+        else:
+            mask = self.genome_kernel.hybrid_mask
+        children = (Individual.from_genome(0, self.bits), Individual.from_genome(0, self.bits))
+        for child in children:
+            self._inherit_mutation_scale(child, parent1, parent2)
+        mutations = [self._planned_mutation(child) for child in children]
+        batch.append((parent1.genome, parent2.genome, mask, children, mutations))
+        return children
+
+    def _planned_mutation(self, individual):
+        mutation_rate, bit_mutation_rate = self._mutation_rates(individual)
+        if random.random() < mutation_rate and (
+            self.mutation_strategy == MutationStrategy.RANDOM_BIT or random.random() < mutation_rate
+        ):
+            return bit_mutation_rate, [random.random() for _ in range(self.bits)]
+        return 0.0, [1.0] * self.bits
+
+    def _recombine_batch(self, batch):
+        parents1, parents2, masks, children, mutations = zip(*batch)
+        rates, draws = zip(*itertools.chain.from_iterable(mutations))
+        genomes = self.genome_kernel.recombine(parents1, parents2, masks, rates, draws)
+        for child, genome in zip(itertools.chain.from_iterable(children), genomes.tolist()):
+            child.genome = genome
+
     def _single_point_crossover(self, parent1, parent2):
         point = random.randint(1, self.bits - 1)
         child1_binary = parent1.binary[:point] + parent2.binary[point:]
         child2_binary = parent2.binary[:point] + parent1.binary[point:]
         child1 = Individual.from_binary(child1_binary, self.bits)
         child2 = Individual.from_binary(child2_binary, self.bits)
+        self._inherit_mutation_scale(child1, parent1, parent2)
+        self._inherit_mutation_scale(child2, parent1, parent2)
 
         self._apply_mutation(child1)
         self._apply_mutation(child2)
@@ -193,6 +301,8 @@ class GeneticAlgorithm:
         
         child1 = Individual.from_binary(child1_binary, self.bits)
         child2 = Individual.from_binary(child2_binary, self.bits)
+        self._inherit_mutation_scale(child1, parent1, parent2)
+        self._inherit_mutation_scale(child2, parent1, parent2)
         
         self._apply_mutation(child1)
         self._apply_mutation(child2)
@@ -200,18 +310,29 @@ class GeneticAlgorithm:
         return child1, child2
 
     
+    def _inherit_mutation_scale(self, child, parent1, parent2):
+        scale = math.sqrt(parent1.mutation_scale * parent2.mutation_scale)
+        if self.adaptation.self_adaptive:
+            scale = self.adaptation.mutate_step(scale, random.gauss(0, 1), self.bits)
+        child.mutation_scale = scale
+
+    def _mutation_rates(self, individual):
+        scale = self.adaptation.scale * individual.mutation_scale
+        return min(1.0, self.mutation_rate * scale), min(1.0, self.bit_mutation_rate * scale)
+
     def _apply_mutation(self, individual):
-        if random.random() < self.mutation_rate:
+        mutation_rate, bit_mutation_rate = self._mutation_rates(individual)
+        if random.random() < mutation_rate:
             if self.mutation_strategy == MutationStrategy.RANDOM_BIT:
-                individual.mutate(self.bit_mutation_rate)
+                individual.mutate(bit_mutation_rate)
             elif self.mutation_strategy == MutationStrategy.COMPLEMENT:
-                self._complement_mutation(individual)
+                self._complement_mutation(individual, mutation_rate, bit_mutation_rate)
 
-    def _complement_mutation(self, individual):
-        if random.random() < self.mutation_rate:
+    def _complement_mutation(self, individual, mutation_rate, bit_mutation_rate):
+        if random.random() < mutation_rate:
             binary_list = list(individual.binary)
             for i in range(len(binary_list)):
-                if random.random() < self.bit_mutation_rate:
+                if random.random() < bit_mutation_rate:
                     binary_list[i] = '1' if binary_list[i] == '0' else '0'
             individual.binary = ''.join(binary_list)
 
@@ -278,3 +399,105 @@ class GeneticAlgorithm:
             (self._decode_individual(ind.binary), fit)
             for ind, fit in zip(self.population, self.fitness)
         ]
+
+    def _encode_individual(self, individual):
+        return -1 if individual is None else individual.genome
+
+    def _decode_individual_bits(self, value):
+        if value < 0:
+            return None
+        return Individual.from_genome(value, self.bits)
+
+    def checkpoint_state(self):
+        with self.lock:
+            return {
+                "bits": np.array(self.bits),
+                "generation": np.array(self.generation),
+                "population": np.array([ind.genome for ind in self.population], dtype=np.uint64),
+                "fitness": np.array(self.fitness, dtype=float),
+                "best": np.array([self._encode_individual(self.best_solution), self._encode_individual(self.worse_solution)]),
+                "best_fitness": np.array([self.best_fitness, self.worse_fitness]),
+                "fitness_history": np.array(self.fitness_history, dtype=float).reshape(-1, 3),
+                "random_state": encode_state(random.getstate()),
+                "mutation_scales": np.array([ind.mutation_scale for ind in self.population], dtype=float),
+                "adaptation": self.adaptation.state(),
+                "adaptation_history": np.array(self.adaptation.history, dtype=float).reshape(-1, 3),
+            }
+
+    def save_checkpoint(self, path=None):
+        if path is not None:
+            self.checkpoint_path = path
+        if self.checkpoint_path is None:
+            raise ValueError("No se especificó una ruta de checkpoint")
+        if self.checkpoint_writer is None:
+            self.checkpoint_writer = CheckpointWriter(self.checkpoint_path)
+        self.checkpoint_writer.save(self.checkpoint_state())
+
+    def restore_checkpoint(self, path=None):
+        path = self.checkpoint_path if path is None else path
+        self.restore_state(read_checkpoint(path))
+
+    def restore_state(self, data):
+        if int(data["bits"]) != self.bits:
+            raise ValueError("El checkpoint no corresponde a los parámetros actuales")
+
+        with self.lock:
+            self.generation = int(data["generation"])
+            self.population = [self._decode_individual_bits(value) for value in data["population"]]
+            self.fitness = data["fitness"].tolist()
+            best, worse = data["best"]
+            self.best_fitness, self.worse_fitness = data["best_fitness"].tolist()
+            self.best_solution = self._decode_individual_bits(best)
+            self.worse_solution = self._decode_individual_bits(worse)
+            self.best_x = None if self.best_solution is None else self._decode_individual(self.best_solution.binary)
+            self.worse_x = None if self.worse_solution is None else self._decode_individual(self.worse_solution.binary)
+            self.fitness_history = [tuple(row) for row in data["fitness_history"].tolist()]
+            if "mutation_scales" in data:
+                for ind, scale in zip(self.population, data["mutation_scales"].tolist()):
+                    ind.mutation_scale = scale
+                self.adaptation.restore(data["adaptation"], data["adaptation_history"])
+
+        version, internal_state, gauss_next = decode_state(data["random_state"])
+        random.setstate((version, tuple(internal_state), gauss_next))
+
+    def cache_key(self):
+        if self.result_cache is None or self.seed is None:
+            return None
+        source = inspect.getsource(inspect.getmodule(type(self.fitness_function))).encode()
+        return cache_key(
+            version=RESULT_CACHE_VERSION,
+            fitness_function=hashlib.sha256(source).hexdigest(),
+            **self.parameters
+        )
+
+    def load_cached_result(self, key):
+        data = self.result_cache.get(key)
+        if data is None:
+            return False
+        self.restore_state(data)
+        return True
+
+    def store_cached_result(self, key):
+        self.result_cache.put(key, self.checkpoint_state())
+
+    def run(self):
+        key = self.cache_key()
+        if key is not None and self.load_cached_result(key):
+            return self.best_x
+
+        if not self.population:
+            self.initialize_population()
+        for i in range(self.generation, int(self.iteration)):
+            self.evolve(i)
+        self.close()
+
+        if key is not None:
+            self.store_cached_result(key)
+        return self.best_x
+
+    def close(self):
+        if self.evaluator is not None and hasattr(self.evaluator, "close"):
+            self.evaluator.close()
+        if self.checkpoint_writer is not None:
+            self.checkpoint_writer.close()
+            self.checkpoint_writer = None
@@ -4,21 +4,30 @@ import random
 class Individual:
     def __init__(self, bits, n_points):
         self.bits = bits
-        self.binary = self._generate_random_binary(n_points)
+        self.mutation_scale = 1.0
+        self.genome = random.randint(0, n_points - 1)
 
     @classmethod
     def from_binary(cls, binary, bits):
+        return cls.from_genome(int(binary, 2), bits)
+
+    @classmethod
+    def from_genome(cls, genome, bits):
         instance = cls(bits, 2**bits)
-        instance.binary = binary
+        instance.genome = int(genome)
         return instance
 
-    def _generate_random_binary(self, n_points):
-        decimal = random.randint(0, n_points - 1)
-        return f"{decimal:0{self.bits}b}"
+    @property
+    def binary(self):
+        return f"{self.genome:0{self.bits}b}"
+
+    @binary.setter
+    def binary(self, binary):
+        self.genome = int(binary, 2)
 
     def mutate(self, bit_mutation_rate):
-        mutated = list(self.binary)
-        for bit in range(len(mutated)):
+        flips = 0
+        for bit in range(self.bits):
             if random.random() < bit_mutation_rate:
-                mutated[bit] = "1" if mutated[bit] == "0" else "0"
-        self.binary = "".join(mutated)
+                flips |= 1 << (self.bits - 1 - bit)
+        self.genome ^= flips
@@ -0,0 +1,154 @@
+import logging
+import math
+import random
+from enum import Enum
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+logger = logging.getLogger(__name__)
+
+class KernelBackend(Enum):
+    NUMPY = "numpy"
+    NUMBA = "numba"
+    AUTO = "auto"
+
+_compiled_kernels = {}
+_compiled_recombine = None
+
+def _compile_numba_kernel(expression):
+    if expression not in _compiled_kernels:
+        evaluate = numba.njit(expression)
+
+        @numba.njit(parallel=True)
+        def decode_and_evaluate(indices, min_val, delta, values, fitness):
+            for i in numba.prange(len(indices)):
+                x = min_val + indices[i] * delta
+                values[i] = x
+                fitness[i] = evaluate(x)
+
+        _compiled_kernels[expression] = decode_and_evaluate
+    return _compiled_kernels[expression]
+
+def _compile_numba_recombine():
+    global _compiled_recombine
+    if _compiled_recombine is None:
+        @numba.njit
+        def flip(genome, rate, draws):
+            bits = len(draws)
+            for bit in range(bits):
+                if draws[bit] < rate:
+                    genome ^= np.int64(1) << (bits - 1 - bit)
+            return genome
+
+        @numba.njit(parallel=True)
+        def recombine(parents1, parents2, masks, rates, draws, children):
+            for i in numba.prange(len(masks)):
+                first = (parents1[i] & ~masks[i]) | (parents2[i] & masks[i])
+                second = (parents2[i] & ~masks[i]) | (parents1[i] & masks[i])
+                children[2 * i] = flip(first, rates[2 * i], draws[2 * i])
+                children[2 * i + 1] = flip(second, rates[2 * i + 1], draws[2 * i + 1])
+
+        _compiled_recombine = recombine
+    return _compiled_recombine
+
+def _numpy_recombine(parents1, parents2, masks, rates, draws, children):
+    children[0::2] = (parents1 & ~masks) | (parents2 & masks)
+    children[1::2] = (parents2 & ~masks) | (parents1 & masks)
+    weights = np.left_shift(1, np.arange(draws.shape[1] - 1, -1, -1, dtype=np.int64))
+    children ^= np.dot(draws < rates[:, np.newaxis], weights)
+
+def _numpy_kernel(expression):
+    def decode_and_evaluate(indices, min_val, delta, values, fitness):
+        np.add(min_val, indices * delta, out=values)
+        fitness[:] = expression(values)
+    return decode_and_evaluate
+
+def resolve_kernel_backend(backend):
+    backend = KernelBackend(backend)
+    if backend == KernelBackend.NUMPY:
+        return backend
+    if numba is None:
+        if backend == KernelBackend.NUMBA:
+            logger.warning("numba no está instalado; se usarán los kernels de NumPy")
+        return KernelBackend.NUMPY
+    return KernelBackend.NUMBA
+
+class FitnessKernel:
+    def __init__(self, backend, expression, min_val, delta, bits):
+        self.backend = resolve_kernel_backend(backend)
+        self.min_val = float(min_val)
+        self.delta = float(delta)
+        self.bits = bits
+        self.function = (
+            _compile_numba_kernel(expression) if self.backend == KernelBackend.NUMBA
+            else _numpy_kernel(expression)
+        )
+
+    def decode_and_evaluate(self, binaries):
+        indices = np.fromiter((int(binary, 2) for binary in binaries), dtype=np.int64, count=len(binaries))
+        return self.decode_and_evaluate_genomes(indices)
+
+    def decode_and_evaluate_genomes(self, genomes):
+        indices = np.asarray(genomes, dtype=np.int64)
+        values = np.empty(len(indices))
+        fitness = np.empty(len(indices))
+        self.function(indices, self.min_val, self.delta, values, fitness)
+        return values, fitness
+
+    def evaluate(self, binaries):
+        return self.decode_and_evaluate(binaries)[1]
+
+    def evaluate_genomes(self, genomes):
+        return self.decode_and_evaluate_genomes(genomes)[1]
+
+    def self_check(self, fitness_function, samples=256, tolerance=1e-12):
+        generator = random.Random(0)
+        binaries = [f"{generator.getrandbits(self.bits):0{self.bits}b}" for _ in range(samples)]
+        binaries += [f"{0:0{self.bits}b}", "1" * self.bits]
+        values, fitness = self.decode_and_evaluate(binaries)
+        for binary, value, kernel_fitness in zip(binaries, values.tolist(), fitness.tolist()):
+            expected_value = self.min_val + int(binary, 2) * self.delta
+            if value != expected_value:
+                return False
+            expected = fitness_function.calculate(expected_value)
+            if not math.isclose(kernel_fitness, expected, rel_tol=tolerance, abs_tol=tolerance):
+                return False
+        return True
+
+def create_fitness_kernel(backend, fitness_function, min_val, delta, bits):
+    kernel = FitnessKernel(backend, fitness_function.expression, min_val, delta, bits)
+    if not kernel.self_check(fitness_function):
+        logger.warning(
+            "El kernel %s no coincide con la función de fitness; se usará la evaluación escalar",
+            kernel.backend.value
+        )
+        return None
+    return kernel
+
+class GenomeKernel:
+    def __init__(self, backend, bits):
+        self.backend = resolve_kernel_backend(backend)
+        self.bits = bits
+        self.hybrid_mask = sum(1 << (bits - 1 - bit) for bit in range(0, bits, 2))
+        self.function = (
+            _compile_numba_recombine() if self.backend == KernelBackend.NUMBA else _numpy_recombine
+        )
+
+    def single_point_mask(self, point):
+        return (1 << (self.bits - point)) - 1
+
+    def recombine(self, parents1, parents2, masks, rates, draws):
+        children = np.empty(2 * len(masks), dtype=np.int64)
+        self.function(
+            np.asarray(parents1, dtype=np.int64),
+            np.asarray(parents2, dtype=np.int64),
+            np.asarray(masks, dtype=np.int64),
+            np.asarray(rates, dtype=np.float64),
+            np.asarray(draws, dtype=np.float64).reshape(len(children), self.bits),
+            children
+        )
+        return children
@@ -10,11 +10,19 @@ from gui.components.buttons import StartButton # type: ignore
 from gui.layout_manager import LayoutManager # type: ignore
 import tkinter as tk
 from tkinter import ttk, messagebox
+import logging
 import os
+import zipfile
+
+CHECKPOINT_PATH = "checkpoints/evolution_checkpoint.npz"
+CHECKPOINT_INTERVAL = 10
+
+logger = logging.getLogger(__name__)
 
 
 class App:
-    def __init__(self):
+    def __init__(self, memory_tracker=None):
+        self.memory_tracker = memory_tracker
         self.root = tk.Tk()
         self.setup_window()
         self.setup_components()
@@ -29,26 +37,47 @@ class App:
         self.plot_canvas = PlotCanvas(self.layout_manager.container_frame)
         self.result_labels = ResultLabels(self.layout_manager.main_frame)
         self.start_button = StartButton(
-            self.layout_manager.main_frame, self.start_algorithm
+            self.layout_manager.main_frame, self.start_algorithm, columnspan=1
+        )
+        self.resume_button = StartButton(
+            self.layout_manager.main_frame, self.resume_algorithm, text="Reanudar", column=1, columnspan=1
         )
 
-    def start_algorithm(self):
+    def resume_algorithm(self):
+        if not os.path.exists(CHECKPOINT_PATH):
+            messagebox.showerror("Error", "No existe un checkpoint para reanudar")
+            return
+        self.start_algorithm(resume=True)
+
+    def start_algorithm(self, resume=False):
         try:
             params = self.input_fields.get_values()
             if not validate_inputs(params):
                 raise ValueError("Invalid input values")
 
             self.start_button.disable()
+            self.resume_button.disable()
             self.plot_canvas.clear()
-
-            algorithm = GeneticAlgorithm(**params)
-            algorithm.initialize_population()
+            if self.memory_tracker is not None:
+                self.memory_tracker.reset()
+
+            algorithm = GeneticAlgorithm(
+                **params,
+                checkpoint_path=CHECKPOINT_PATH,
+                checkpoint_interval=CHECKPOINT_INTERVAL,
+                memory_tracker=self.memory_tracker
+            )
+            if resume:
+                algorithm.restore_checkpoint()
+            else:
+                algorithm.initialize_population()
 
             run_in_thread(self.evolution_process, algorithm, params["iteration"])
 
-        except ValueError as e:
+        except (ValueError, KeyError, OSError, zipfile.BadZipFile) as e:
             messagebox.showerror("Error", str(e))
             self.start_button.enable()
+            self.resume_button.enable()
 
     def evolution_process(self, algorithm, iterations):
         iterations = int(iterations)
@@ -56,7 +85,7 @@ class App:
         os.makedirs(temp_dir, exist_ok=True)
 
         try:
-            for i in range(iterations):
+            for i in range(algorithm.generation, iterations):
                 algorithm.evolve(i)
                 self.update_gui(algorithm)
 
@@ -68,6 +97,11 @@ class App:
             messagebox.showinfo("Video Generado", f"El video se ha guardado como {output_file}")
 
         finally:
+            algorithm.save_checkpoint()
+            algorithm.close()
+            if self.memory_tracker is not None:
+                self.memory_tracker.sample(algorithm.generation, force=True)
+                logger.info(self.memory_tracker.format_report())
             for file in os.listdir(temp_dir):
                 os.remove(os.path.join(temp_dir, file))
             os.rmdir(temp_dir)
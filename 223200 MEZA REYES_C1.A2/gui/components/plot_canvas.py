@@ -13,10 +13,6 @@ class PlotCanvas:
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.grid(row=0, column=1, sticky="nsew", padx=10, pady=10)
 
-        self.best_fitness_history = []
-        self.worst_fitness_history = []
-        self.avg_fitness_history = []
-
     def clear(self):
         self.ax.clear()
         self.fitness_ax.clear()
@@ -53,28 +49,22 @@ class PlotCanvas:
         self.ax.legend()
 
     def _update_fitness_plot(self, algorithm):
-        current_best = max(algorithm.fitness)
-        current_worst = min(algorithm.fitness)
-        current_avg = sum(algorithm.fitness) / len(algorithm.fitness)
-
-        self.best_fitness_history.append(current_best)
-        self.worst_fitness_history.append(current_worst)
-        self.avg_fitness_history.append(current_avg)
+        best_history, worst_history, avg_history = zip(*algorithm.fitness_history)
 
         self.fitness_ax.clear()
         self.fitness_ax.set_title("Evolución de la Aptitud")
         self.fitness_ax.set_xlabel("Iteraciones")
         self.fitness_ax.set_ylabel("Aptitud")
 
-        iterations = range(1, len(self.best_fitness_history) + 1)
+        iterations = range(1, len(best_history) + 1)
         self.fitness_ax.plot(
-            iterations, self.best_fitness_history, label="Mejor", color="green"
+            iterations, best_history, label="Mejor", color="green"
         )
         self.fitness_ax.plot(
-            iterations, self.worst_fitness_history, label="Peor", color="red"
+            iterations, worst_history, label="Peor", color="red"
         )
         self.fitness_ax.plot(
-            iterations, self.avg_fitness_history, label="Promedio", color="blue"
+            iterations, avg_history, label="Promedio", color="blue"
         )
         self.fitness_ax.legend()
     def save_fx_plot(self, filepath):
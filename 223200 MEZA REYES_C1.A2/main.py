@@ -1,8 +1,21 @@
+import argparse
+import logging
 from gui.app import App
+from utils.memory import MemoryTracker
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Algoritmo Genetico Concurrente")
+    parser.add_argument("--memory", action="store_true", help="Registrar el uso de memoria por generación")
+    parser.add_argument("--memory-interval", type=int, default=10)
+    return parser.parse_args()
 
 
 def main():
-    app = App()
+    arguments = parse_arguments()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    memory_tracker = MemoryTracker(arguments.memory_interval) if arguments.memory else None
+    app = App(memory_tracker=memory_tracker)
     app.run()
 
 
@@ -0,0 +1,106 @@
+import math
+import random
+import numpy as np
+import pytest
+from algorithm.fitness_function import FitnessFunction
+from algorithm.genetic_algorithm import GeneticAlgorithm, CrossoverStrategy, MutationStrategy
+from algorithm.kernels import KernelBackend, FitnessKernel, GenomeKernel, create_fitness_kernel, numba
+from utils.adaptation import AdaptationStrategy
+
+TOLERANCE = 1e-12
+def backends():
+    available = [KernelBackend.NUMPY]
+    if numba is not None:
+        available.append(KernelBackend.NUMBA)
+    return available
+
+def create_algorithm(**kwargs):
+    return GeneticAlgorithm(0.01, -10, 10, 5, 40, 20, 0.8, 0.3, 0.3, seed=3, **kwargs)
+
+@pytest.mark.parametrize("backend", backends())
+def test_kernel_matches_scalar_fitness(backend):
+    fitness_function = FitnessFunction()
+    kernel = FitnessKernel(backend, fitness_function.expression, -10.0, 20.0 / 4095, 12)
+    binaries = [f"{index:012b}" for index in range(4096)]
+    values, fitness = kernel.decode_and_evaluate(binaries)
+    expected = [fitness_function.calculate(value) for value in values.tolist()]
+    np.testing.assert_allclose(fitness, expected, rtol=TOLERANCE, atol=TOLERANCE)
+
+@pytest.mark.parametrize("backend", backends())
+def test_zero_is_consistent_across_paths(backend):
+    fitness_function = FitnessFunction()
+    kernel = FitnessKernel(backend, fitness_function.expression, 0.0, 0.5, 4)
+    values, fitness = kernel.decode_and_evaluate(["0000", "0001"])
+    assert values[0] == 0.0
+    assert fitness[0] == fitness_function.calculate(0.0) == 0.0
+    assert math.isclose(fitness[1], fitness_function.calculate(0.5), rel_tol=TOLERANCE)
+
+@pytest.mark.parametrize("backend", backends())
+def test_kernel_passes_self_check(backend):
+    kernel = create_fitness_kernel(backend, FitnessFunction(), -10.0, 20.0 / 4095, 12)
+    assert kernel is not None and kernel.backend == backend
+
+def test_mismatching_fitness_function_falls_back_to_scalar_path():
+    class ShiftedFitness(FitnessFunction):
+        def calculate(self, x):
+            return super().calculate(x) + 1.0
+
+    assert create_fitness_kernel(KernelBackend.NUMPY, ShiftedFitness(), -10.0, 0.01, 11) is None
+
+def test_default_backend_matches_scalar_path():
+    vectorized = create_algorithm()
+    scalar = create_algorithm(kernel_backend=None)
+    assert vectorized.kernel is not None and scalar.kernel is None
+    vectorized.initialize_population()
+    scalar.initialize_population()
+    assert [ind.binary for ind in vectorized.population] == [ind.binary for ind in scalar.population]
+    np.testing.assert_allclose(vectorized.fitness, scalar.fitness, rtol=TOLERANCE, atol=TOLERANCE)
+
+def flip_bits(binary, rate, draws):
+    return "".join(
+        ("1" if bit == "0" else "0") if draw < rate else bit for bit, draw in zip(binary, draws)
+    )
+
+@pytest.mark.parametrize("backend", backends())
+def test_recombine_matches_string_operators(backend):
+    bits = 12
+    kernel = GenomeKernel(backend, bits)
+    generator = random.Random(5)
+    parents1 = [generator.getrandbits(bits) for _ in range(200)]
+    parents2 = [generator.getrandbits(bits) for _ in range(200)]
+    points = [generator.randint(1, bits - 1) for _ in range(200)]
+    rates = [generator.choice([0.0, 0.2, 1.0]) for _ in range(400)]
+    draws = [[generator.random() for _ in range(bits)] for _ in range(400)]
+    masks = [kernel.hybrid_mask if i % 3 == 0 else kernel.single_point_mask(point) for i, point in enumerate(points)]
+    children = kernel.recombine(parents1, parents2, masks, rates, draws).tolist()
+
+    for i, (parent1, parent2, point) in enumerate(zip(parents1, parents2, points)):
+        binary1, binary2 = f"{parent1:0{bits}b}", f"{parent2:0{bits}b}"
+        if i % 3 == 0:
+            pairs = [(b2, b1) if j % 2 == 0 else (b1, b2) for j, (b1, b2) in enumerate(zip(binary1, binary2))]
+            expected = ["".join(pair[0] for pair in pairs), "".join(pair[1] for pair in pairs)]
+        else:
+            expected = [binary1[:point] + binary2[point:], binary2[:point] + binary1[point:]]
+        for k in range(2):
+            child = flip_bits(expected[k], rates[2 * i + k], draws[2 * i + k])
+            assert f"{children[2 * i + k]:0{bits}b}" == child
+
+@pytest.mark.parametrize("backend", backends())
+@pytest.mark.parametrize("crossover_strategy", list(CrossoverStrategy))
+@pytest.mark.parametrize("mutation_strategy", list(MutationStrategy))
+@pytest.mark.parametrize("adaptation", [AdaptationStrategy.FIXED, AdaptationStrategy.SELF_ADAPTIVE])
+def test_genome_kernel_run_matches_string_path(backend, crossover_strategy, mutation_strategy, adaptation):
+    def run(kernel_backend):
+        algorithm = GeneticAlgorithm(
+            0.01, -10, 10, 8, 40, 20, 0.9, 0.8, 0.3, seed=7,
+            crossover_strategy=crossover_strategy, mutation_strategy=mutation_strategy,
+            adaptation=adaptation, kernel_backend=kernel_backend
+        )
+        best_x = algorithm.run()
+        return best_x, [ind.binary for ind in algorithm.population], algorithm.fitness_history
+
+    kernel_x, kernel_population, kernel_history = run(backend)
+    string_x, string_population, string_history = run(None)
+    assert kernel_x == string_x
+    assert kernel_population == string_population
+    np.testing.assert_allclose(kernel_history, string_history, rtol=TOLERANCE, atol=TOLERANCE)
@@ -0,0 +1,90 @@
+import math
+from enum import Enum
+import numpy as np
+
+class AdaptationStrategy(Enum):
+    FIXED = "fixed"
+    SUCCESS_RULE = "success_rule"
+    SELF_ADAPTIVE = "self_adaptive"
+    DECAY = "decay"
+
+class RateAdaptation:
+    def __init__(self, strategy=AdaptationStrategy.FIXED, crossover_rate=0.5, iterations=100,
+                 target_success=0.2, factor=0.85, final_ratio=0.1, crossover_step=0.05,
+                 min_scale=0.01, max_scale=10.0, min_crossover_rate=0.05, max_crossover_rate=0.95):
+        if not 0 < factor < 1:
+            raise ValueError("El factor de adaptación debe estar entre 0 y 1")
+        if not 0 < target_success < 1:
+            raise ValueError("La tasa de éxito objetivo debe estar entre 0 y 1")
+        self.strategy = AdaptationStrategy(strategy)
+        self.crossover_rate = crossover_rate
+        self.iterations = max(1, int(iterations))
+        self.target_success = target_success
+        self.factor = factor
+        self.final_ratio = final_ratio
+        self.crossover_step = crossover_step
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.min_crossover_rate = min(min_crossover_rate, crossover_rate)
+        self.max_crossover_rate = max(max_crossover_rate, crossover_rate)
+        self.scale = 1.0
+        self.history = []
+        self.reset_counts()
+
+    @property
+    def self_adaptive(self):
+        return self.strategy == AdaptationStrategy.SELF_ADAPTIVE
+
+    def reset_counts(self):
+        self.trials = [0, 0]
+        self.successes = [0, 0]
+
+    def observe(self, successes, trials, crossed=False):
+        self.successes[int(crossed)] += int(successes)
+        self.trials[int(crossed)] += int(trials)
+
+    def operator_success(self, crossed):
+        trials = self.trials[int(crossed)]
+        return None if trials == 0 else self.successes[int(crossed)] / trials
+
+    @property
+    def success_rate(self):
+        trials = sum(self.trials)
+        return None if trials == 0 else sum(self.successes) / trials
+
+    def clip_scale(self, scale):
+        return min(max(scale, self.min_scale), self.max_scale)
+
+    def mutate_step(self, step, noise, num_genes):
+        return self.clip_scale(step * math.exp(noise / math.sqrt(max(1, num_genes))))
+
+    def update(self, generation, step_size=1.0):
+        success_rate = self.success_rate
+        if self.strategy == AdaptationStrategy.DECAY:
+            self.scale = self.final_ratio ** (min(generation, self.iterations) / self.iterations)
+        elif self.strategy == AdaptationStrategy.SUCCESS_RULE and success_rate is not None:
+            if success_rate > self.target_success:
+                self.scale = self.clip_scale(self.scale / self.factor)
+            elif success_rate < self.target_success:
+                self.scale = self.clip_scale(self.scale * self.factor)
+
+            crossover, mutation = self.operator_success(True), self.operator_success(False)
+            if crossover is not None and mutation is not None and crossover != mutation:
+                step = self.crossover_step if crossover > mutation else -self.crossover_step
+                self.crossover_rate = min(
+                    max(self.crossover_rate + step, self.min_crossover_rate), self.max_crossover_rate
+                )
+
+        self.history.append((
+            self.scale * step_size, self.crossover_rate, math.nan if success_rate is None else success_rate
+        ))
+        self.reset_counts()
+
+    def state(self):
+        return np.array([self.scale, self.crossover_rate, *self.trials, *self.successes], dtype=float)
+
+    def restore(self, state, history):
+        self.scale, self.crossover_rate = float(state[0]), float(state[1])
+        self.trials = [int(value) for value in state[2:4]]
+        self.successes = [int(value) for value in state[4:6]]
+        self.history = [tuple(row) for row in np.asarray(history).tolist()]
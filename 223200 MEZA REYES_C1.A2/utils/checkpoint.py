@@ -0,0 +1,55 @@
+import json
+import os
+import threading
+from pathlib import Path
+import numpy as np
+
+def encode_state(state):
+    return np.frombuffer(json.dumps(state).encode("utf-8"), dtype=np.uint8)
+
+def decode_state(data):
+    return json.loads(np.asarray(data, dtype=np.uint8).tobytes().decode("utf-8"))
+
+def write_checkpoint(path, arrays):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as file:
+        np.savez_compressed(file, **arrays)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+def read_checkpoint(path):
+    with np.load(path, allow_pickle=False) as data:
+        return {key: data[key] for key in data.files}
+
+class CheckpointWriter:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.pending = None
+        self.closed = False
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.write_pending, daemon=True)
+        self.thread.start()
+
+    def save(self, arrays):
+        with self.condition:
+            self.pending = arrays
+            self.condition.notify()
+
+    def write_pending(self):
+        while True:
+            with self.condition:
+                while self.pending is None and not self.closed:
+                    self.condition.wait()
+                arrays, self.pending = self.pending, None
+                if arrays is None:
+                    return
+            write_checkpoint(self.path, arrays)
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.thread.join()
@@ -1,140 +1,995 @@
 import numpy as np
+import math
 import random
-import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from queue import Queue
+from enum import Enum
+from utils.cancellation import OperationCancelled
+from utils.checkpoint import CheckpointWriter, encode_state, decode_state, read_checkpoint
+from utils.result_cache import cache_key, hash_array
+from utils.concurrency import ConcurrencyConfig
+from utils.adaptation import AdaptationStrategy, RateAdaptation
+from .losses import LossFunction, reduce_errors, batch_errors
+from .preprocessing import StandardScaler
+from .shared_memory_backend import SharedMemoryEvaluator
+from .distributed_backend import DistributedEvaluator
+from .model import RegressionModel
+from .kernels import KernelBackend, resolve_kernel_backend, fused_batch_errors
+
+class EvaluationBackend(Enum):
+    THREAD = "thread"
+    PROCESS = "process"
+    DISTRIBUTED = "distributed"
+
+class ReplacementStrategy(Enum):
+    GENERATIONAL = "generational"
+    ELITISM = "elitism"
+    MU_PLUS_LAMBDA = "mu_plus_lambda"
+    STEADY_STATE = "steady_state"
+
+class InitializationStrategy(Enum):
+    RANDOM = "random"
+    LEAST_SQUARES = "least_squares"
+    ROBUST_L1 = "robust_l1"
+
+class SelectionStrategy(Enum):
+    TRUNCATION = "truncation"
+    TOURNAMENT = "tournament"
+    LINEAR_RANK = "linear_rank"
+    STOCHASTIC_UNIVERSAL = "stochastic_universal"
+
+class Precision(Enum):
+    FLOAT64 = "float64"
+    FLOAT32 = "float32"
+
+RESULT_CACHE_VERSION = 1
+EXECUTION_PARAMETERS = (
+    "self", "dataset", "num_workers", "backend", "batch_size", "blas_threads", "auto_tune",
+    "cancel_token", "chunk_rows", "metrics", "checkpoint_path", "checkpoint_interval",
+    "worker_addresses", "memory_tracker", "result_cache",
+)
 
 class GeneticAlgorithm:
     def __init__(self, dataset, iterations, population_size, crossover_rate, mutation_rate, 
-                 min_interval_mutation_rate, max_interval_mutation_rate, num_workers=4):
-        self.dataset = dataset
+                 min_interval_mutation_rate, max_interval_mutation_rate, num_workers=None,
+                 sample_size=None, stratified_sampling=False, num_strata=10,
+                 full_evaluation_count=1, seed=None, loss=LossFunction.MAE,
+                 incremental_fitness=True,
+                 replacement_strategy=ReplacementStrategy.GENERATIONAL, elite_count=1,
+                 offspring_count=None, standardize=False, scaler=None,
+                 initialization_strategy=InitializationStrategy.RANDOM, warm_start_share=0.5,
+                 warm_start_noise=0.1, robust_iterations=20, local_search_interval=0,
+                 local_search_count=1, local_search_budget=20, local_search_step=0.1,
+                 backend=EvaluationBackend.THREAD, batch_size=None, blas_threads=None,
+                 auto_tune=False, asynchronous=False, cancel_token=None, chunk_rows=65536,
+                 metrics=None, checkpoint_path=None, checkpoint_interval=0, worker_addresses=None,
+                 memory_tracker=None, result_cache=None, precision=Precision.FLOAT64,
+                 adaptation=AdaptationStrategy.FIXED, target_success_rate=0.2, adaptation_factor=0.85,
+                 decay_final_ratio=0.1, kernel_backend=KernelBackend.NUMPY,
+                 selection_strategy=SelectionStrategy.TRUNCATION, tournament_size=2,
+                 selection_pressure=1.5):
+        self.parameters = {
+            key: value for key, value in locals().items() if key not in EXECUTION_PARAMETERS
+        }
         self.iterations = iterations
         self.population_size = int(population_size)
         self.crossover_rate = crossover_rate
         self.mutation_rate = mutation_rate
         self.min_interval_mutation_rate = min_interval_mutation_rate
         self.max_interval_mutation_rate = max_interval_mutation_rate
-        self.num_workers = num_workers
+        if worker_addresses and num_workers is None:
+            num_workers = len(worker_addresses)
+        self.concurrency = ConcurrencyConfig(num_workers, batch_size, blas_threads)
+        self.num_workers = self.concurrency.num_workers
+        self.backend = EvaluationBackend(backend)
+        self.evaluator = None
+        self.worker_addresses = worker_addresses
+        self.asynchronous = asynchronous
+        self.cancel_token = cancel_token
+        self.chunk_rows = chunk_rows
+        self.metrics = metrics
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = int(checkpoint_interval)
+        self.checkpoint_writer = None
+        self.memory_tracker = memory_tracker
+        self.result_cache = result_cache
+        self.dataset_hash = None if result_cache is None else hash_array(dataset)
+        self.logger = logging.getLogger(__name__)
+        self.start_time = None
+        self.async_executor = None
+        self.in_flight = {}
+        self.stratified_sampling = stratified_sampling
+        self.full_evaluation_count = max(1, int(full_evaluation_count))
+        self.loss = LossFunction(loss)
+        self.replacement_strategy = ReplacementStrategy(replacement_strategy)
+        self.elite_count = int(elite_count)
+        self.offspring_count = self.resolve_offspring_count(offspring_count)
+        self.initialization_strategy = InitializationStrategy(initialization_strategy)
+        self.selection_strategy = SelectionStrategy(selection_strategy)
+        if not 1 <= tournament_size <= self.population_size:
+            raise ValueError("El tamaño del torneo debe estar entre 1 y el tamaño de población")
+        if not 1 <= selection_pressure <= 2:
+            raise ValueError("La presión de selección debe estar entre 1 y 2")
+        self.tournament_size = int(tournament_size)
+        self.selection_pressure = selection_pressure
+        if not 0 <= warm_start_share <= 1:
+            raise ValueError("La proporción de arranque en caliente debe estar entre 0 y 1")
+        self.warm_start_share = warm_start_share
+        self.warm_start_noise = warm_start_noise
+        self.robust_iterations = int(robust_iterations)
+        self.local_search_interval = int(local_search_interval)
+        self.local_search_count = int(local_search_count)
+        self.local_search_budget = int(local_search_budget)
+        self.local_search_step = local_search_step
+        self.adaptation = RateAdaptation(
+            adaptation, crossover_rate, iterations, target_success_rate, adaptation_factor,
+            decay_final_ratio
+        )
+        self.kernel_backend = resolve_kernel_backend(kernel_backend)
+        self.precision = Precision(precision)
+        self.dtype = np.dtype(self.precision.value)
+        self.rng = np.random.default_rng(seed)
+        if seed is not None:
+            random.seed(seed)
                 
-        self.yd = dataset[:, -1]
-        self.X = dataset[:, 1:-1]
+        X = dataset[:, 1:-1]
+        yd = dataset[:, -1]
+        if scaler is None and standardize:
+            scaler = StandardScaler(X, yd)
+        self.scaler = scaler
+        self.features = self.working_array(X, None if scaler is None else scaler.transform_features)
+        self.target = self.working_array(yd, None if scaler is None else scaler.transform_target)
+        self.X, self.yd = (X, yd) if self.precision == Precision.FLOAT64 else (None, None)
+        self.sample_size = self.resolve_sample_size(sample_size)
+        if asynchronous and self.sample_size is not None:
+            raise ValueError("El modo asíncrono requiere evaluar el dataset completo")
+        self.strata = self.build_strata(num_strata) if stratified_sampling else None
+        self.sufficient_statistics = (
+            None if self.loss == LossFunction.MAE else self.compute_sufficient_statistics()
+        )
+        self.track_residuals = (
+            incremental_fitness and self.sample_size is None and self.sufficient_statistics is None
+            and not (asynchronous and self.backend == EvaluationBackend.PROCESS)
+            and self.backend != EvaluationBackend.DISTRIBUTED
+        )
                 
         self.best_solutions = []
-        self.yc_per_generation = []
+        self.sampled_fitness_history = []
+        self.current_yc = None
         self.population = self.initialize_population()
+        self.fitness = np.full(self.population_size, np.nan)
+        self.step_sizes = np.ones(self.population_size)
+        self.pending_lineage = None
+        self.residuals = (
+            np.empty((self.population_size, len(self.target)), dtype=self.dtype)
+            if self.track_residuals else None
+        )
+        self.current_rows = None
+        self.evaluations = 0
+        self.incremental_evaluations = 0
+        self.reused_evaluations = 0
+        self.local_search_evaluations = 0
                 
         self.evolution_lock = threading.Lock()
         self.results_lock = threading.Lock()
         self.generation_complete = threading.Event()
         self.fitness_queue = Queue()
 
+        if auto_tune:
+            self.calibrate_concurrency()
+
     def initialize_population(self):
-        rng = np.random.default_rng(int(time.time()))
-        num_features = self.X.shape[1]
-        return rng.uniform(-1, 1, size=(self.population_size, num_features + 1))
+        num_features = self.features.shape[1]
+        population = self.rng.uniform(-1, 1, size=(self.population_size, num_features + 1))
+        population = population.astype(self.dtype, copy=False)
+        if self.initialization_strategy == InitializationStrategy.RANDOM:
+            return population
+
+        num_seeded = int(round(self.warm_start_share * self.population_size))
+        if num_seeded > 0:
+            solution = self.warm_start_solution()
+            noise_scale = self.warm_start_noise * np.maximum(np.abs(solution), 1.0)
+            noise = self.rng.normal(0, 1, size=(num_seeded, num_features + 1)) * noise_scale
+            noise[0] = 0
+            population[:num_seeded] = solution + noise
+        return population
+
+    def design_matrix(self, X=None):
+        X = self.features if X is None else X
+        return np.column_stack((np.ones(len(X)), X))
+
+    def warm_start_solution(self):
+        if self.sufficient_statistics is not None:
+            gram, xty, _ = self.sufficient_statistics
+            solution = np.linalg.lstsq(gram, xty, rcond=None)[0]
+        else:
+            solution = np.linalg.lstsq(self.design_matrix(), self.target, rcond=None)[0]
+        if self.initialization_strategy == InitializationStrategy.LEAST_SQUARES:
+            return solution
+
+        design = self.design_matrix()
+        for _ in range(self.robust_iterations):
+            residual = self.target - design @ solution
+            sqrt_weights = 1.0 / np.sqrt(np.maximum(np.abs(residual), 1e-8))
+            solution = np.linalg.lstsq(
+                design * sqrt_weights[:, np.newaxis], self.target * sqrt_weights, rcond=None
+            )[0]
+        return solution
+
+    def resolve_offspring_count(self, offspring_count):
+        if self.replacement_strategy == ReplacementStrategy.ELITISM:
+            if not 0 < self.elite_count < self.population_size:
+                raise ValueError("El número de élites debe estar entre 1 y el tamaño de población - 1")
+            return self.population_size - self.elite_count
+        if offspring_count is None or self.replacement_strategy == ReplacementStrategy.GENERATIONAL:
+            if self.replacement_strategy == ReplacementStrategy.STEADY_STATE:
+                return 2
+            return self.population_size
+        offspring_count = int(offspring_count)
+        if offspring_count <= 0:
+            raise ValueError("El número de descendientes debe ser mayor que 0")
+        if self.replacement_strategy == ReplacementStrategy.STEADY_STATE:
+            return min(offspring_count, self.population_size)
+        return offspring_count
+
+    def resolve_sample_size(self, sample_size):
+        if sample_size is None:
+            return None
+        num_rows = len(self.target)
+        if sample_size <= 0:
+            raise ValueError("El tamaño de muestra debe ser mayor que 0")
+        if sample_size <= 1:
+            rows = int(round(sample_size * num_rows))
+        else:
+            rows = int(sample_size)
+        rows = max(1, rows)
+        return None if rows >= num_rows else rows
+
+    def build_strata(self, num_strata):
+        num_strata = max(1, min(int(num_strata), self.sample_size or len(self.target)))
+        return np.array_split(np.argsort(self.target, kind="stable"), num_strata)
+
+    def sample_rows(self):
+        if self.sample_size is None:
+            return None
+        num_rows = len(self.target)
+        if self.strata is None:
+            return self.rng.choice(num_rows, size=self.sample_size, replace=False)
+
+        rows = []
+        for stratum in self.strata:
+            stratum_size = max(1, int(round(self.sample_size * len(stratum) / num_rows)))
+            rows.append(self.rng.choice(stratum, size=min(stratum_size, len(stratum)), replace=False))
+        return np.concatenate(rows)
+
+    def compute_sufficient_statistics(self):
+        design = self.design_matrix()
+        target = self.target.astype(np.float64, copy=False)
+        return design.T @ design, design.T @ target, float(target @ target)
+
+    def reduce_errors(self, error_vector, axis=None):
+        return reduce_errors(error_vector, self.loss, axis)
+
+    def squared_loss_from_statistics(self, individuals):
+        gram, xty, yty = self.sufficient_statistics
+        sse = np.einsum("ij,jk,ik->i", individuals, gram, individuals) - 2 * (individuals @ xty) + yty
+        mse = np.maximum(sse, 0) / len(self.target)
+        return np.sqrt(mse) if self.loss == LossFunction.RMSE else mse
+
+    def fitness_function(self, individual, X=None, yd=None):
+        if X is None and self.sufficient_statistics is not None:
+            return self.squared_loss_from_statistics(individual[np.newaxis, :])[0]
+        X = self.features if X is None else X
+        yd = self.target if yd is None else yd
+        yc = np.dot(X, individual[1:]) + individual[0]
+        error_vector = yd - yc
+        return self.reduce_errors(error_vector)
+
+    def calculate_fitness_batch(self, individuals, X=None, yd=None, keep_residuals=False):
+        if X is None and self.sufficient_statistics is not None:
+            return self.squared_loss_from_statistics(individuals), None
+        X = self.features if X is None else X
+        yd = self.target if yd is None else yd
+        if self.kernel_backend == KernelBackend.NUMBA and not keep_residuals:
+            return fused_batch_errors(
+                X, yd, individuals, self.loss, self.chunk_rows, self.cancel_token
+            ), None
+        return batch_errors(
+            X, yd, individuals, self.loss, keep_residuals, self.chunk_rows, self.cancel_token
+        )
+
+    def design_columns(self, genes):
+        columns = np.ones((len(self.target), len(genes)), dtype=self.dtype)
+        weights = genes > 0
+        columns[:, weights] = self.features[:, genes[weights] - 1]
+        return columns
+
+    def inherit_fitness(self, parent, genes, deltas):
+        parent_residual = None if self.residuals is None else self.residuals[parent]
+        if len(genes) == 0:
+            self.reused_evaluations += 1
+            return self.fitness[parent], parent_residual
+        if parent_residual is None:
+            return np.nan, None
+
+        residual = parent_residual - self.design_columns(genes) @ deltas.astype(self.dtype)
+        self.incremental_evaluations += 1
+        return self.reduce_errors(residual), residual
 
-    def fitness_function(self, individual):
-        yc = np.dot(self.X, individual[1:]) + individual[0]
-        error_vector = self.yd - yc
-        return np.abs(error_vector).mean()
+    def mutation_step(self, num_genes, step_size=1.0):
+        scale = self.adaptation.scale * step_size
+        num_mutations = int(self.mutation_rate * num_genes)
+        if num_mutations <= 0:
+            return np.empty(0, dtype=int), np.empty(0)
 
-    def calculate_fitness_batch(self, individuals):
-        return [(self.fitness_function(ind), ind) for ind in individuals]
+        genes = np.array(random.sample(range(num_genes), num_mutations))
+        deltas = np.array([
+            random.choice([-1, 1]) * random.uniform(self.min_interval_mutation_rate,
+                                                    self.max_interval_mutation_rate) * scale
+            for _ in genes
+        ])
+        return genes, deltas
 
     def mutate(self, individual):
         mutated_individual = individual.copy()
-        num_genes = len(individual)
-        num_mutations = int(self.mutation_rate * num_genes)
-        
-        if num_mutations > 0:
-            genes_to_mutate = random.sample(range(num_genes), num_mutations)
-            for gene in genes_to_mutate:
-                mutation_value = random.uniform(self.min_interval_mutation_rate, 
-                                             self.max_interval_mutation_rate)
-                gene_transform = random.choice([-1, 1])
-                mutated_individual[gene] += gene_transform * mutation_value
-        
+        genes, deltas = self.mutation_step(len(individual))
+        mutated_individual[genes] += deltas
         return mutated_individual
 
-    def crossover(self, parent1, parent2):
-        if random.random() < self.crossover_rate:
+    def recombine(self, parent1, parent2):
+        if random.random() < self.adaptation.crossover_rate:
             crossover_point = random.randint(1, len(parent1) - 1)
-            offspring = np.concatenate((parent1[:crossover_point], parent2[crossover_point:]))
-        else:
-            offspring = parent1.copy()
+            return np.concatenate((parent1[:crossover_point], parent2[crossover_point:])), True
+        return parent1.copy(), False
+
+    def crossover(self, parent1, parent2):
+        offspring, _ = self.recombine(parent1, parent2)
         return offspring
 
-    def parallel_fitness_calculation(self, population):
-        batch_size = max(1, len(population) // self.num_workers)
-        population_batches = [
-            population[i:i + batch_size] 
-            for i in range(0, len(population), batch_size)
-        ]
+    def get_evaluator(self):
+        if self.backend == EvaluationBackend.DISTRIBUTED:
+            if self.evaluator is None:
+                self.evaluator = DistributedEvaluator(
+                    self.features, self.target, self.loss, self.worker_addresses,
+                    self.num_workers, self.chunk_rows
+                )
+            return self.evaluator
+        if self.evaluator is not None and (
+            self.evaluator.num_workers != self.num_workers
+            or self.evaluator.blas_threads != self.concurrency.blas_threads
+        ):
+            self.close_evaluator()
+        if self.evaluator is None:
+            residual_capacity = (
+                max(self.population_size, self.offspring_count) if self.track_residuals else 0
+            )
+            self.evaluator = SharedMemoryEvaluator(
+                self.features, self.target, self.loss, self.num_workers, residual_capacity,
+                self.concurrency.blas_threads, self.chunk_rows,
+                self.kernel_backend == KernelBackend.NUMBA
+            )
+        return self.evaluator
+
+    def check_cancelled(self):
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+
+    def close_evaluator(self):
+        for future in self.in_flight:
+            future.cancel()
+        self.in_flight = {}
+        if self.async_executor is not None:
+            self.async_executor.shutdown(wait=True, cancel_futures=True)
+            self.async_executor = None
+        if self.evaluator is not None:
+            self.evaluator.close()
+            self.evaluator = None
+
+    def close(self):
+        self.close_evaluator()
+        if self.metrics is not None:
+            self.metrics.close()
+        if self.checkpoint_writer is not None:
+            self.checkpoint_writer.close()
+            self.checkpoint_writer = None
+
+    def calibrate_concurrency(self, repeats=2):
+        if self.sufficient_statistics is not None:
+            return None
+        evaluations = self.evaluations
+        keep_residuals = self.residuals is not None
+
+        def evaluate(num_workers, batch_size, blas_threads):
+            self.num_workers = self.concurrency.num_workers = num_workers
+            self.concurrency.batch_size = batch_size
+            self.concurrency.blas_threads = blas_threads
+            self.parallel_fitness_calculation(self.population, keep_residuals=keep_residuals)
+
+        best = self.concurrency.calibrate(evaluate, len(self.population), repeats=repeats)
+        self.num_workers = self.concurrency.num_workers
+        self.evaluations = evaluations
+        return best
+
+    def parallel_fitness_calculation(self, population, rows=None, keep_residuals=False):
+        batch_size = self.concurrency.resolve_batch_size(len(population))
+        uses_statistics = rows is None and self.sufficient_statistics is not None
+        if self.backend != EvaluationBackend.THREAD and not uses_statistics:
+            self.evaluations += len(population)
+            return self.get_evaluator().evaluate(
+                population, rows, keep_residuals, batch_size, self.cancel_token
+            )
+
+        X, yd = (None, None) if rows is None else (self.features[rows], self.target[rows])
+        num_rows = len(self.target) if yd is None else len(yd)
         
-        fitness_scores = []
-        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-            future_to_batch = {
-                executor.submit(self.calculate_fitness_batch, batch): batch 
-                for batch in population_batches
+        fitness = np.empty(len(population))
+        residuals = np.empty((len(population), num_rows), dtype=self.dtype) if keep_residuals else None
+        with self.concurrency.blas_limit(), ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            future_to_start = {
+                executor.submit(
+                    self.calculate_fitness_batch, population[i:i + batch_size], X, yd, keep_residuals
+                ): i
+                for i in range(0, len(population), batch_size)
             }
             
-            for future in as_completed(future_to_batch):
-                fitness_scores.extend(future.result())
+            for future in as_completed(future_to_start):
+                start = future_to_start[future]
+                batch_fitness, batch_residuals = future.result()
+                fitness[start:start + len(batch_fitness)] = batch_fitness
+                if keep_residuals:
+                    residuals[start:start + len(batch_fitness)] = batch_residuals
         
-        return sorted(fitness_scores, key=lambda x: x[0])
+        self.evaluations += len(population)
+        return fitness, residuals
+
+    def to_original_fitness(self, fitness):
+        if self.scaler is None:
+            return fitness
+        return self.scaler.inverse_fitness(fitness, squared=self.loss == LossFunction.MSE)
+
+    def to_original_weights(self, individual):
+        if self.scaler is None:
+            return individual
+        return self.scaler.inverse_weights(individual)
+
+    def evaluate_pending(self, population, fitness, residuals, rows=None):
+        pending = np.flatnonzero(np.isnan(fitness))
+        if len(pending) == 0:
+            return
+        pending_fitness, pending_residuals = self.parallel_fitness_calculation(
+            population[pending], rows, keep_residuals=residuals is not None
+        )
+        fitness[pending] = pending_fitness
+        if pending_residuals is not None:
+            residuals[pending] = pending_residuals
+
+    def evaluate_candidate(self, individual):
+        fitness, residuals = self.calculate_fitness_batch(
+            individual[np.newaxis, :], keep_residuals=self.sufficient_statistics is None
+        )
+        return fitness[0], (None if residuals is None else residuals[0])
+
+    def descent_direction(self, individual, residual):
+        if self.sufficient_statistics is not None:
+            gram, xty, _ = self.sufficient_statistics
+            return gram @ individual - xty
+        signs = np.sign(residual)
+        return -np.concatenate(([signs.sum()], self.features.T @ signs))
+
+    def local_search_due(self):
+        if self.local_search_interval <= 0 or self.current_rows is not None:
+            return False
+        return (len(self.best_solutions) + 1) % self.local_search_interval == 0
+
+    def local_search(self):
+        budget = self.local_search_budget
+        for index in np.argsort(self.fitness, kind="stable")[:self.local_search_count]:
+            if budget <= 0:
+                break
+            budget -= self.improve_individual(index, budget)
+
+    def improve_individual(self, index, budget):
+        individual = self.population[index]
+        fitness = self.fitness[index]
+        residual = None if self.residuals is None else self.residuals[index]
+        used = 0
+        if residual is None and self.sufficient_statistics is None:
+            fitness, residual = self.evaluate_candidate(individual)
+            used += 1
+
+        step = self.local_search_step
+        direction = self.descent_direction(individual, residual)
+        while used < budget and step > 1e-8:
+            self.check_cancelled()
+            norm = np.linalg.norm(direction)
+            if norm == 0:
+                break
+            candidate = (individual - step * direction / norm).astype(self.dtype, copy=False)
+            candidate_fitness, candidate_residual = self.evaluate_candidate(candidate)
+            used += 1
+            if candidate_fitness < fitness:
+                individual, fitness, residual = candidate, candidate_fitness, candidate_residual
+                direction = self.descent_direction(individual, residual)
+                step *= 2
+            else:
+                step *= 0.5
+
+        self.population[index] = individual
+        self.fitness[index] = fitness
+        if self.residuals is not None:
+            self.residuals[index] = residual
+        self.local_search_evaluations += used
+        return used
+
+    def evaluate_population(self):
+        self.check_cancelled()
+        self.current_rows = self.sample_rows()
+        if self.current_rows is not None:
+            self.fitness[:] = np.nan
+        self.evaluate_pending(self.population, self.fitness, self.residuals, self.current_rows)
+        if self.pending_lineage is not None:
+            offset, lineage = self.pending_lineage
+            self.observe_offspring(self.fitness, lineage, offset)
+            self.pending_lineage = None
+        if self.local_search_due():
+            self.local_search()
+
+        if self.current_rows is None:
+            best = int(np.argmin(self.fitness))
+            return self.fitness, (self.fitness[best], self.population[best].copy()), self.fitness[best]
 
-    def evolve_population(self):
+        candidates = np.argsort(self.fitness, kind="stable")[:self.full_evaluation_count]
+        full_fitness, _ = self.calculate_fitness_batch(self.population[candidates])
+        self.evaluations += len(candidates)
+        best = int(np.argmin(full_fitness))
+        best_solution = (full_fitness[best], self.population[candidates[best]].copy())
+        return self.fitness, best_solution, self.fitness[candidates[0]]
+
+    def offspring_step_size(self, parent1, parent2, crossed, num_genes):
+        step_size = self.step_sizes[parent1]
+        if crossed:
+            step_size = math.sqrt(step_size * self.step_sizes[parent2])
+        if self.adaptation.self_adaptive:
+            step_size = self.adaptation.mutate_step(step_size, self.rng.standard_normal(), num_genes)
+        return step_size
+
+    def observe_offspring(self, fitness, lineage, offset=0):
+        _, parent_fitness, crossed = lineage
+        fitness = fitness[offset:offset + len(parent_fitness)]
+        evaluated = ~np.isnan(fitness)
+        improved = evaluated & (fitness < parent_fitness)
+        for operator in (False, True):
+            mask = crossed == operator
+            self.adaptation.observe(
+                np.count_nonzero(improved & mask), np.count_nonzero(evaluated & mask), operator
+            )
+
+    def tournament_selection(self, count):
+        candidates = self.rng.integers(0, len(self.fitness), size=(count * 2, self.tournament_size))
+        winners = np.argmin(self.fitness[candidates], axis=1)
+        return candidates[np.arange(len(candidates)), winners]
+
+    def linear_rank_probabilities(self):
+        num_individuals = len(self.fitness)
+        if num_individuals == 1:
+            return np.ones(1)
+        ranks = np.empty(num_individuals)
+        ranks[np.argsort(self.fitness, kind="stable")] = np.arange(num_individuals - 1, -1, -1)
+        pressure = self.selection_pressure
+        return (2 - pressure + 2 * (pressure - 1) * ranks / (num_individuals - 1)) / num_individuals
+
+    def linear_rank_selection(self, count):
+        return self.rng.choice(len(self.fitness), size=count * 2, p=self.linear_rank_probabilities())
+
+    def stochastic_universal_sampling(self, count):
+        weights = self.fitness.max() - self.fitness
+        if not np.isfinite(weights.sum()) or weights.sum() <= 0:
+            weights = np.ones(len(self.fitness))
+        cumulative = np.cumsum(weights)
+        spacing = cumulative[-1] / (count * 2)
+        pointers = (self.rng.random() + np.arange(count * 2)) * spacing
+        selected = np.minimum(np.searchsorted(cumulative, pointers, side="right"), len(weights) - 1)
+        return self.rng.permutation(selected)
+
+    def select_parents(self, count):
+        if self.selection_strategy == SelectionStrategy.TOURNAMENT:
+            parents = self.tournament_selection(count)
+        elif self.selection_strategy == SelectionStrategy.LINEAR_RANK:
+            parents = self.linear_rank_selection(count)
+        else:
+            parents = self.stochastic_universal_sampling(count)
+        return parents.reshape(count, 2).tolist()
+
+    def breed(self, selected, count):
+        self.check_cancelled()
+        reuse_fitness = self.current_rows is None
+        population = np.empty((count, self.population.shape[1]), dtype=self.dtype)
+        fitness = np.full(count, np.nan)
+        residuals = (
+            None if self.residuals is None
+            else np.empty((count, self.residuals.shape[1]), dtype=self.dtype)
+        )
+        step_sizes = np.empty(count)
+        parent_fitness = np.empty(count)
+        crossed_offspring = np.zeros(count, dtype=bool)
+        parents = (
+            None if self.selection_strategy == SelectionStrategy.TRUNCATION
+            else self.select_parents(count)
+        )
+        for child in range(count):
+            if parents is None:
+                parent1, parent2 = random.sample(selected, 2)
+            else:
+                parent1, parent2 = parents[child]
+                            
+            offspring, crossed = self.recombine(self.population[parent1], self.population[parent2])
+            step_sizes[child] = self.offspring_step_size(parent1, parent2, crossed, len(offspring))
+            genes, deltas = self.mutation_step(len(offspring), step_sizes[child])
+            offspring[genes] += deltas
+            population[child] = offspring
+            parent_fitness[child] = (
+                min(self.fitness[parent1], self.fitness[parent2]) if crossed else self.fitness[parent1]
+            )
+            crossed_offspring[child] = crossed
+
+            if reuse_fitness and not crossed:
+                fitness[child], residual = self.inherit_fitness(parent1, genes, deltas)
+                if residual is not None:
+                    residuals[child] = residual
+        return population, fitness, residuals, (step_sizes, parent_fitness, crossed_offspring)
+
+    def keep_individuals(self, indices, population=None, fitness=None, residuals=None):
+        population = self.population if population is None else population
+        fitness = self.fitness if fitness is None else fitness
+        residuals = self.residuals if residuals is None else residuals
+        self.population = population[indices]
+        self.fitness = fitness[indices]
+        self.residuals = None if residuals is None else residuals[indices]
+        self.step_sizes = self.step_sizes[indices]
+
+    def replace_population(self, order, selected):
+        strategy = self.replacement_strategy
+        offspring, offspring_fitness, offspring_residuals, lineage = self.breed(
+            selected, self.offspring_count
+        )
+
+        if strategy == ReplacementStrategy.GENERATIONAL:
+            self.population = offspring
+            self.fitness = offspring_fitness
+            self.residuals = offspring_residuals
+            self.step_sizes = lineage[0]
+            self.pending_lineage = (0, lineage)
+            return
+
+        if strategy == ReplacementStrategy.ELITISM:
+            self.keep_individuals(order[:self.elite_count])
+            self.pending_lineage = (self.elite_count, lineage)
+        else:
+            self.evaluate_pending(offspring, offspring_fitness, offspring_residuals, self.current_rows)
+            self.observe_offspring(offspring_fitness, lineage)
+            if strategy == ReplacementStrategy.STEADY_STATE:
+                self.keep_individuals(order[:self.population_size - self.offspring_count])
+
+        self.population = np.concatenate((self.population, offspring))
+        self.fitness = np.concatenate((self.fitness, offspring_fitness))
+        self.step_sizes = np.concatenate((self.step_sizes, lineage[0]))
+        if self.residuals is not None:
+            self.residuals = np.concatenate((self.residuals, offspring_residuals))
+
+        if strategy == ReplacementStrategy.MU_PLUS_LAMBDA:
+            self.keep_individuals(np.argsort(self.fitness, kind="stable")[:self.population_size])
+
+    def submit_evaluation(self, individuals):
+        if self.backend != EvaluationBackend.THREAD and self.sufficient_statistics is None:
+            return self.get_evaluator().submit(individuals)
+        if self.async_executor is None:
+            self.async_executor = ThreadPoolExecutor(max_workers=self.num_workers)
+        return self.async_executor.submit(
+            self.calculate_fitness_batch, individuals, None, None, self.residuals is not None
+        )
+
+    def submit_offspring(self):
+        selected = np.argsort(self.fitness, kind="stable")[:self.population_size // 2].tolist()
+        count = self.concurrency.resolve_batch_size(self.population_size)
+        offspring, fitness, residuals, lineage = self.breed(selected, count)
+        pending = np.flatnonzero(np.isnan(fitness))
+        future = self.submit_evaluation(offspring[pending])
+        self.in_flight[future] = (offspring, fitness, residuals, lineage, pending)
+
+    def insert_offspring(self, future):
+        offspring, fitness, residuals, lineage, pending = self.in_flight.pop(future)
+        result = future.result()
+        if self.backend != EvaluationBackend.THREAD and self.sufficient_statistics is None:
+            pending_fitness, pending_residuals = result[1], None
+        else:
+            pending_fitness, pending_residuals = result
+        fitness[pending] = pending_fitness
+        if residuals is not None and pending_residuals is not None:
+            residuals[pending] = pending_residuals
+        self.evaluations += len(pending)
+        self.observe_offspring(fitness, lineage)
+
+        for child in range(len(offspring)):
+            worst = int(np.argmax(self.fitness))
+            if fitness[child] < self.fitness[worst]:
+                self.population[worst] = offspring[child]
+                self.fitness[worst] = fitness[child]
+                self.step_sizes[worst] = lineage[0][child]
+                if self.residuals is not None:
+                    self.residuals[worst] = residuals[child]
+        return len(offspring)
+
+    def evolve_asynchronously(self):
+        self.evaluate_pending(self.population, self.fitness, self.residuals)
+        completed = 0
+        while completed < self.population_size:
+            while len(self.in_flight) < 2 * self.num_workers:
+                self.submit_offspring()
+            done, _ = wait(list(self.in_flight), timeout=0.05, return_when=FIRST_COMPLETED)
+            if self.cancel_token is not None and self.cancel_token.cancelled:
+                if self.evaluator is not None:
+                    self.evaluator.cancel(list(self.in_flight))
+                self.check_cancelled()
+            for future in done:
+                completed += self.insert_offspring(future)
+
+        if self.local_search_due():
+            self.local_search()
+        best = int(np.argmin(self.fitness))
+        return (self.fitness[best], self.population[best].copy()), self.fitness[best]
+
+    def record_metrics(self, best_fitness, fitness):
+        if self.metrics is None:
+            return
+        fitness = self.to_original_fitness(fitness[~np.isnan(fitness)])
+        self.metrics.append(
+            len(self.best_solutions), best_fitness, fitness.mean(), fitness.max(),
+            self.evaluations, time.perf_counter() - self.start_time
+        )
+
+    def record_generation(self, best_solution, sampled_fitness, fitness):
+        with self.results_lock:
+            best_fitness, best_individual = best_solution
+            best_solution = (
+                self.to_original_fitness(best_fitness),
+                self.to_original_weights(best_individual),
+            )
+            previous_best = self.best_solutions[-1][1] if self.best_solutions else None
+            self.best_solutions.append(best_solution)
+            self.sampled_fitness_history.append(self.to_original_fitness(sampled_fitness))
+            best_individual = best_solution[1]
+            if previous_best is None or not np.array_equal(previous_best, best_individual):
+                self.current_yc = self.predict(best_individual)
+        self.record_metrics(best_solution[0], fitness)
+
+    def evolve_population(self, cancel_token=None):
+        if cancel_token is not None:
+            self.cancel_token = cancel_token
+        if self.start_time is None:
+            self.start_time = time.perf_counter()
         with self.evolution_lock:            
-            fitness_scores = self.parallel_fitness_calculation(self.population)
-                        
-            selected_population = [ind for _, ind in fitness_scores[:self.population_size // 2]]
-                        
-            new_population = []
-            while len(new_population) < self.population_size:
-                parent1, parent2 = random.sample(selected_population, 2)
-                                
-                offspring = self.crossover(parent1, parent2)
-                offspring = self.mutate(offspring)
-                new_population.append(offspring)
-            
-            self.population = np.array(new_population)
+            if self.asynchronous:
+                best_solution, sampled_fitness = self.evolve_asynchronously()
+                self.record_generation(best_solution, sampled_fitness, self.fitness)
+                self.finish_generation()
+                return
+
+            fitness, best_solution, sampled_fitness = self.evaluate_population()
+            generation_fitness = fitness.copy()
                         
+            order = np.argsort(fitness, kind="stable")
+            selected = order[:self.population_size // 2].tolist()
+            self.replace_population(order, selected)
+            self.record_generation(best_solution, sampled_fitness, generation_fitness)
+            self.finish_generation()
+
+    def finish_generation(self):
+        generation = len(self.best_solutions)
+        self.adaptation.update(generation, float(np.mean(self.step_sizes)))
+        if self.checkpoint_interval > 0 and generation % self.checkpoint_interval == 0:
+            self.save_checkpoint()
+        if self.memory_tracker is not None:
+            self.memory_tracker.sample(generation)
+
+    def checkpoint_state(self):
+        with self.results_lock:
+            best_fitness = np.array([fitness for fitness, _ in self.best_solutions], dtype=float)
+            best_weights = np.array([weights for _, weights in self.best_solutions], dtype=float)
+            sampled_fitness = np.array(self.sampled_fitness_history, dtype=float)
+        lineage_offset, lineage = (-1, np.empty((0, 3))) if self.pending_lineage is None else (
+            self.pending_lineage[0], np.column_stack(self.pending_lineage[1])
+        )
+        return {
+            "shape": np.array([self.population_size, self.population.shape[1]]),
+            "loss": np.array(self.loss.value),
+            "standardized": np.array(self.scaler is not None),
+            "population": self.population.copy(),
+            "fitness": self.fitness.copy(),
+            "best_fitness": best_fitness,
+            "best_weights": best_weights.reshape(len(best_fitness), self.population.shape[1]),
+            "sampled_fitness": sampled_fitness,
+            "counters": np.array([
+                self.evaluations, self.incremental_evaluations,
+                self.reused_evaluations, self.local_search_evaluations,
+            ]),
+            "rng_state": encode_state(self.rng.bit_generator.state),
+            "random_state": encode_state(random.getstate()),
+            "step_sizes": self.step_sizes.copy(),
+            "adaptation": self.adaptation.state(),
+            "adaptation_history": np.array(self.adaptation.history, dtype=float).reshape(-1, 3),
+            "lineage": lineage,
+            "lineage_offset": np.array(lineage_offset),
+        }
+
+    def save_checkpoint(self, path=None):
+        if path is not None:
+            self.checkpoint_path = path
+        if self.checkpoint_path is None:
+            raise ValueError("No se especificó una ruta de checkpoint")
+        if self.checkpoint_writer is None:
+            self.checkpoint_writer = CheckpointWriter(self.checkpoint_path)
+        self.checkpoint_writer.save(self.checkpoint_state())
+
+    def restore_checkpoint(self, path=None):
+        path = self.checkpoint_path if path is None else path
+        self.restore_state(read_checkpoint(path))
+
+    def restore_state(self, data):
+        if data["shape"].tolist() != [self.population_size, self.population.shape[1]]:
+            raise ValueError("El checkpoint no corresponde a la población o al dataset actual")
+        if str(data["loss"]) != self.loss.value:
+            raise ValueError("El checkpoint fue generado con otra función de pérdida")
+        if "standardized" in data and bool(data["standardized"]) != (self.scaler is not None):
+            raise ValueError("El checkpoint fue generado con otra configuración de estandarización")
+
+        with self.evolution_lock:
+            self.population = data["population"].astype(self.dtype, copy=False)
+            self.fitness = data["fitness"]
+            if self.residuals is not None:
+                evaluated = ~np.isnan(self.fitness)
+                _, residuals = self.calculate_fitness_batch(self.population[evaluated], keep_residuals=True)
+                self.residuals[evaluated] = residuals
+            (self.evaluations, self.incremental_evaluations,
+             self.reused_evaluations, self.local_search_evaluations) = data["counters"].tolist()
+            self.rng.bit_generator.state = decode_state(data["rng_state"])
+            version, internal_state, gauss_next = decode_state(data["random_state"])
+            random.setstate((version, tuple(internal_state), gauss_next))
+            if "step_sizes" in data:
+                self.step_sizes = data["step_sizes"]
+                self.adaptation.restore(data["adaptation"], data["adaptation_history"])
+                lineage = data["lineage"]
+                self.pending_lineage = None if int(data["lineage_offset"]) < 0 else (
+                    int(data["lineage_offset"]),
+                    (lineage[:, 0], lineage[:, 1], lineage[:, 2].astype(bool)),
+                )
+
             with self.results_lock:
-                self.best_solutions.append(fitness_scores[0])
-                best_individual = fitness_scores[0][1]
-                yc = np.dot(self.X, best_individual[1:]) + best_individual[0]
-                self.yc_per_generation.append(yc)
+                self.best_solutions = list(zip(data["best_fitness"].tolist(), data["best_weights"]))
+                self.sampled_fitness_history = data["sampled_fitness"].tolist()
+                self.current_yc = self.predict(self.best_solutions[-1][1]) if self.best_solutions else None
 
-    def run(self):
-        progress_queue = Queue()
-        
-        def evolution_worker():
-            for gen in range(self.iterations):
-                self.evolve_population()
-                progress_queue.put((gen, self.best_solutions[-1][0]))
-        
-        evolution_thread = threading.Thread(target=evolution_worker)
-        evolution_thread.start()
-        
-        completed_generations = 0
-        while completed_generations < self.iterations:
-            gen, fitness = progress_queue.get()
-            completed_generations += 1
-            print(f"Generación {gen + 1}: Mejor Fitness = {fitness}")
-        
-        evolution_thread.join()
-        return self.best_solutions[-1][1]
+    def working_array(self, array, transform=None):
+        if transform is None and array.dtype == self.dtype:
+            return array
+        result = np.empty(array.shape, dtype=self.dtype)
+        step = self.chunk_rows or max(1, len(array))
+        for start in range(0, len(array), step):
+            block = array[start:start + step]
+            result[start:start + step] = block if transform is None else transform(block)
+        return result
+
+    def precision_drift(self, population=None, dataset=None):
+        population = self.population if population is None else population
+        X, yd = self.features, self.target
+        if dataset is not None:
+            X = np.asarray(dataset[:, 1:-1], dtype=np.float64)
+            yd = np.asarray(dataset[:, -1], dtype=np.float64)
+            if self.scaler is not None:
+                X, yd = self.scaler.transform_features(X), self.scaler.transform_target(yd)
+        individuals = np.asarray(population, dtype=np.float64)
+        reference, _ = batch_errors(X, yd, individuals, self.loss, chunk_rows=self.chunk_rows)
+        computed, _ = self.calculate_fitness_batch(np.asarray(population, dtype=self.dtype))
+        absolute = np.abs(computed - reference)
+        relative = absolute / np.maximum(np.abs(reference), np.finfo(np.float64).tiny)
+        return {
+            "precision": self.precision.value,
+            "max_absolute": float(absolute.max()),
+            "max_relative": float(relative.max()),
+            "mean_relative": float(relative.mean()),
+            "same_best": bool(np.argmin(computed) == np.argmin(reference)),
+            "rank_changes": int(np.count_nonzero(
+                np.argsort(computed, kind="stable") != np.argsort(reference, kind="stable")
+            )),
+        }
+
+    def cache_key(self):
+        if self.result_cache is None or self.parameters["seed"] is None or self.asynchronous:
+            return None
+        return cache_key(
+            version=RESULT_CACHE_VERSION, dataset=self.dataset_hash, **self.parameters
+        )
+
+    def load_cached_result(self, key):
+        data = self.result_cache.get(key)
+        if data is None:
+            return False
+        self.restore_state(data)
+        with self.results_lock:
+            self.current_yc = data["predictions"]
+        self.logger.info("Resultado recuperado de la caché (%s)", key[:12])
+        return True
+
+    def store_cached_result(self, key):
+        data = self.checkpoint_state()
+        data["predictions"] = self.get_yc()
+        self.result_cache.put(key, data)
+
+    def run(self, cancel_token=None):
+        key = self.cache_key()
+        if key is not None and self.load_cached_result(key):
+            return self.best_solutions[-1][1]
+
+        try:
+            for _ in range(self.iterations):
+                self.evolve_population(cancel_token)
+        except OperationCancelled:
+            self.logger.info("Ejecución cancelada")
+        finally:
+            self.close()
+        if key is not None and len(self.best_solutions) == self.iterations:
+            self.store_cached_result(key)
+        if self.best_solutions:
+            self.logger.info(
+                "%d generaciones: Mejor Fitness = %s", len(self.best_solutions), self.best_solutions[-1][0]
+            )
+            if self.precision != Precision.FLOAT64:
+                drift = self.precision_drift()
+                self.logger.info(
+                    "Desviación de fitness %s vs float64: máxima relativa = %.3e, mismo mejor = %s",
+                    drift["precision"], drift["max_relative"], drift["same_best"]
+                )
+        return self.best_solutions[-1][1] if self.best_solutions else None
 
     def get_yd(self):
+        if self.yd is None:
+            target = self.target.astype(np.float64)
+            self.yd = target if self.scaler is None else self.scaler.inverse_target(target)
         return self.yd
 
+    def predict(self, weights):
+        if self.X is not None:
+            return np.dot(self.X, weights[1:]) + weights[0]
+        individual = np.asarray(weights, dtype=np.float64)
+        if self.scaler is not None:
+            individual = self.scaler.transform_weights(individual)
+        yc = (np.dot(self.features, individual[1:].astype(self.dtype)) + individual[0]).astype(np.float64)
+        return yc if self.scaler is None else self.scaler.inverse_target(yc)
+
+    def export_model(self, path, feature_names=None):
+        model = RegressionModel.from_algorithm(self, feature_names)
+        model.save(path)
+        self.logger.info("Modelo exportado a %s", path)
+        return model
+
     def get_yc(self, generation=None):
         with self.results_lock:
             if generation is None:
-                generation = len(self.yc_per_generation) - 1
-            return self.yc_per_generation[generation]
+                return self.current_yc
+            return self.predict(self.best_solutions[generation][1])
+
+    def get_adaptation_history(self):
+        return list(self.adaptation.history)
 
     def get_best_solutions(self):
         with self.results_lock:
-            return self.best_solutions.copy()
\ No newline at end of file
+            return self.best_solutions.copy()
+
+    def get_fitness_estimates(self):
+        with self.results_lock:
+            return [
+                (sampled, full)
+                for sampled, (full, _) in zip(self.sampled_fitness_history, self.best_solutions)
+            ]
\ No newline at end of file
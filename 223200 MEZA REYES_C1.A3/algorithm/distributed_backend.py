@@ -0,0 +1,358 @@
+import hashlib
+import itertools
+import json
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, InvalidStateError, wait, FIRST_COMPLETED
+import numpy as np
+from .losses import LossFunction, batch_errors
+from .kernels import process_context
+
+_LENGTH = struct.Struct("!I")
+_ALLOWED_KINDS = "biuf"
+
+def _receive_exactly(sock, size):
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("Conexión cerrada por el otro extremo")
+        received += count
+    return buffer
+
+def send_message(sock, header, arrays=()):
+    arrays = [np.ascontiguousarray(array) for array in arrays]
+    header = dict(header, arrays=[(array.dtype.str, array.shape) for array in arrays])
+    payload = json.dumps(header).encode("utf-8")
+    sock.sendall(_LENGTH.pack(len(payload)) + payload)
+    for array in arrays:
+        sock.sendall(array.reshape(-1).view(np.uint8))
+
+def receive_message(sock):
+    (length,) = _LENGTH.unpack(_receive_exactly(sock, _LENGTH.size))
+    header = json.loads(_receive_exactly(sock, length).decode("utf-8"))
+    arrays = []
+    for dtype, shape in header.pop("arrays", []):
+        dtype = np.dtype(dtype)
+        if dtype.kind not in _ALLOWED_KINDS:
+            raise ValueError(f"Tipo de dato no permitido: {dtype}")
+        size = int(np.prod(shape)) * dtype.itemsize
+        arrays.append(np.frombuffer(_receive_exactly(sock, size), dtype=dtype).reshape(shape))
+    return header, arrays
+
+def dataset_hash(features, target):
+    digest = hashlib.sha256()
+    for array in (features, target):
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode("utf-8"))
+        digest.update(array.data)
+    return digest.hexdigest()
+
+def parse_address(address):
+    if isinstance(address, str):
+        host, _, port = address.rpartition(":")
+        return host or "127.0.0.1", int(port)
+    host, port = address
+    return host, int(port)
+
+class _EvaluationHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        server = self.server
+        try:
+            send_message(self.request, {"type": "hello", "datasets": server.cached_hashes()})
+            while True:
+                header, arrays = receive_message(self.request)
+                if header["type"] == "dataset":
+                    server.store_dataset(header["hash"], *arrays)
+                elif header["type"] == "evaluate":
+                    self.evaluate(header, arrays)
+        except (ConnectionError, OSError):
+            return
+
+    def evaluate(self, header, arrays):
+        dataset = self.server.get_dataset(header["hash"])
+        if dataset is None:
+            send_message(self.request, {
+                "type": "missing_dataset", "task": header["task"], "hash": header["hash"],
+                "message": f"El trabajador no tiene el dataset {header['hash']}",
+            })
+            return
+        try:
+            features, target = dataset
+            individuals = arrays[0]
+            if len(arrays) > 1:
+                features, target = features[arrays[1]], target[arrays[1]]
+            errors, _ = batch_errors(
+                features, target, individuals, LossFunction(header["loss"]),
+                chunk_rows=header.get("chunk_rows")
+            )
+        except Exception as e:
+            send_message(self.request, {"type": "error", "task": header["task"], "message": str(e)})
+            return
+        send_message(self.request, {"type": "result", "task": header["task"]}, [errors])
+
+class EvaluationServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, cache_size=2):
+        super().__init__(address, _EvaluationHandler)
+        self.cache_size = max(1, int(cache_size))
+        self.datasets = OrderedDict()
+        self.datasets_lock = threading.Lock()
+
+    def cached_hashes(self):
+        with self.datasets_lock:
+            return list(self.datasets)
+
+    def store_dataset(self, key, features, target):
+        if dataset_hash(features, target) != key:
+            raise ValueError("El hash del dataset recibido no coincide")
+        with self.datasets_lock:
+            self.datasets[key] = (features, target)
+            self.datasets.move_to_end(key)
+            while len(self.datasets) > self.cache_size:
+                self.datasets.popitem(last=False)
+
+    def get_dataset(self, key):
+        with self.datasets_lock:
+            if key not in self.datasets:
+                return None
+            self.datasets.move_to_end(key)
+            return self.datasets[key]
+
+def run_worker(host="127.0.0.1", port=9100, cache_size=2, ready=None):
+    with EvaluationServer((host, port), cache_size) as server:
+        if ready is not None:
+            ready.send(server.server_address[1])
+            ready.close()
+        server.serve_forever()
+
+def start_local_workers(count, cache_size=2):
+    context = process_context()
+    processes, addresses = [], []
+    for _ in range(count):
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=run_worker, args=("127.0.0.1", 0, cache_size, sender), daemon=True
+        )
+        process.start()
+        sender.close()
+        addresses.append(("127.0.0.1", receiver.recv()))
+        receiver.close()
+        processes.append(process)
+    return processes, addresses
+
+class _Task:
+    def __init__(self, task_id, individuals, start, rows):
+        self.id = task_id
+        self.individuals = individuals
+        self.start = start
+        self.rows = rows
+        self.future = Future()
+        self.dispatched_at = None
+
+class DistributedEvaluator:
+    def __init__(self, features, target, loss, addresses=None, num_local_workers=1, chunk_rows=None,
+                 straggler_timeout=5.0, worker_timeout=60.0, max_failures=3, max_backoff=30.0):
+        self.features = np.ascontiguousarray(features)
+        self.target = np.ascontiguousarray(target)
+        self.loss = loss
+        self.chunk_rows = chunk_rows
+        self.straggler_timeout = straggler_timeout
+        self.worker_timeout = worker_timeout
+        self.max_failures = max_failures
+        self.max_backoff = max_backoff
+        self.dataset_hash = dataset_hash(self.features, self.target)
+
+        self.local_workers = []
+        if addresses is None:
+            self.local_workers, addresses = start_local_workers(num_local_workers)
+        self.addresses = [parse_address(address) for address in addresses]
+        self.num_workers = len(self.addresses)
+
+        self.tasks = queue.Queue()
+        self.outstanding = {}
+        self.task_ids = itertools.count()
+        self.lock = threading.Lock()
+        self.sockets = set()
+        self.closed = threading.Event()
+        self.live_connections = self.num_workers
+        self.threads = [
+            threading.Thread(target=self.serve_connection, args=(address,), daemon=True)
+            for address in self.addresses
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def submit_slice(self, individuals, start=0, rows=None):
+        task = _Task(next(self.task_ids), np.asarray(individuals), start, rows)
+        with self.lock:
+            if self.live_connections == 0:
+                raise ConnectionError("No hay trabajadores remotos disponibles")
+            self.outstanding[task.id] = task
+        self.tasks.put(task)
+        return task.future
+
+    def submit(self, individuals, rows=None):
+        return self.submit_slice(individuals, 0, rows)
+
+    def evaluate(self, population, rows=None, keep_residuals=False, batch_size=None,
+                 cancel_token=None):
+        if keep_residuals:
+            raise ValueError("El backend distribuido no conserva residuos")
+
+        batch_size = batch_size or max(1, -(-len(population) // self.num_workers))
+        pending = {
+            self.submit_slice(population[i:i + batch_size], i, rows)
+            for i in range(0, len(population), batch_size)
+        }
+
+        fitness = np.empty(len(population))
+        while pending:
+            done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            if cancel_token is not None and cancel_token.cancelled:
+                self.cancel(pending)
+                cancel_token.raise_if_cancelled()
+            for future in done:
+                start, errors = future.result()
+                fitness[start:start + len(errors)] = errors
+        return fitness, None
+
+    def next_task(self):
+        try:
+            return self.tasks.get(timeout=0.05)
+        except queue.Empty:
+            pass
+        now = time.monotonic()
+        with self.lock:
+            for task in self.outstanding.values():
+                if task.dispatched_at is not None and now - task.dispatched_at > self.straggler_timeout:
+                    task.dispatched_at = now
+                    return task
+        return None
+
+    def finish(self, task, result=None, error=None):
+        with self.lock:
+            self.outstanding.pop(task.id, None)
+        try:
+            if error is None:
+                task.future.set_result((task.start, result))
+            else:
+                task.future.set_exception(error)
+        except InvalidStateError:
+            pass
+
+    def requeue(self, task):
+        if not task.future.done():
+            task.dispatched_at = None
+            self.tasks.put(task)
+
+    def connect(self, address):
+        sock = socket.create_connection(address, timeout=self.worker_timeout)
+        with self.lock:
+            self.sockets.add(sock)
+        hello, _ = receive_message(sock)
+        if self.dataset_hash not in hello["datasets"]:
+            self.send_dataset(sock)
+        return sock
+
+    def send_dataset(self, sock):
+        send_message(sock, {"type": "dataset", "hash": self.dataset_hash}, [self.features, self.target])
+
+    def run_task(self, sock, task):
+        header = {
+            "type": "evaluate", "task": task.id, "hash": self.dataset_hash,
+            "loss": self.loss.value, "chunk_rows": self.chunk_rows,
+        }
+        arrays = [task.individuals] if task.rows is None else [task.individuals, np.asarray(task.rows)]
+        send_message(sock, header, arrays)
+        reply, payload = receive_message(sock)
+        if reply["type"] == "missing_dataset":
+            self.send_dataset(sock)
+            send_message(sock, header, arrays)
+            reply, payload = receive_message(sock)
+        if reply["type"] in ("error", "missing_dataset"):
+            self.finish(task, error=RuntimeError(reply["message"]))
+        else:
+            self.finish(task, payload[0])
+
+    def serve_connection(self, address):
+        failures, live = 0, True
+        while not self.closed.is_set():
+            sock, task = None, None
+            try:
+                sock = self.connect(address)
+                failures = 0
+                if not live:
+                    live = True
+                    self.connection_restored()
+                while not self.closed.is_set():
+                    task = self.next_task()
+                    if task is None or task.future.done():
+                        continue
+                    if task.dispatched_at is None:
+                        task.dispatched_at = time.monotonic()
+                    self.run_task(sock, task)
+                    task = None
+            except (OSError, ConnectionError, ValueError):
+                failures += 1
+                if task is not None:
+                    self.requeue(task)
+                if live and failures >= self.max_failures:
+                    live = False
+                    self.connection_lost()
+                self.closed.wait(min(self.max_backoff, 0.1 * 2 ** min(failures, 16)))
+            finally:
+                if sock is not None:
+                    with self.lock:
+                        self.sockets.discard(sock)
+                    sock.close()
+        if live:
+            self.connection_lost()
+
+    def connection_restored(self):
+        with self.lock:
+            self.live_connections += 1
+
+    def connection_lost(self):
+        with self.lock:
+            self.live_connections -= 1
+            if self.live_connections > 0 or self.closed.is_set():
+                return
+            tasks = list(self.outstanding.values())
+        for task in tasks:
+            self.finish(task, error=ConnectionError("No hay trabajadores remotos disponibles"))
+
+    def cancel(self, futures=()):
+        for future in futures:
+            future.cancel()
+        with self.lock:
+            for task_id in [key for key, task in self.outstanding.items() if task.future.cancelled()]:
+                del self.outstanding[task_id]
+
+    def close(self):
+        if self.closed.is_set():
+            return
+        self.closed.set()
+        with self.lock:
+            for sock in self.sockets:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            tasks = list(self.outstanding.values())
+        for thread in self.threads:
+            thread.join()
+        for task in tasks:
+            task.future.cancel()
+        for process in self.local_workers:
+            process.terminate()
+            process.join()
@@ -0,0 +1,97 @@
+import logging
+import multiprocessing
+from enum import Enum
+import numpy as np
+from .losses import LossFunction, batch_errors
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+logger = logging.getLogger(__name__)
+_verified_backends = {}
+_parallel_runtime_started = False
+
+class KernelBackend(Enum):
+    NUMPY = "numpy"
+    NUMBA = "numba"
+    AUTO = "auto"
+
+if numba is not None:
+    @numba.njit(parallel=True)
+    def _fused_error_sums(X, yd, individuals, squared):
+        num_rows, num_features = X.shape
+        num_individuals = individuals.shape[0]
+        num_blocks = max(1, min(num_rows, 4 * numba.get_num_threads()))
+        partial = np.zeros((num_blocks, num_individuals))
+        for block in numba.prange(num_blocks):
+            start = block * num_rows // num_blocks
+            stop = (block + 1) * num_rows // num_blocks
+            for row in range(start, stop):
+                for k in range(num_individuals):
+                    yc = individuals[k, 0]
+                    for j in range(num_features):
+                        yc += X[row, j] * individuals[k, j + 1]
+                    error = yd[row] - yc
+                    if squared:
+                        partial[block, k] += error * error
+                    else:
+                        partial[block, k] += abs(error)
+        return partial.sum(axis=0)
+
+def process_context():
+    return multiprocessing.get_context("spawn" if _parallel_runtime_started else None)
+
+def fused_batch_errors(X, yd, individuals, loss, chunk_rows=None, cancel_token=None):
+    global _parallel_runtime_started
+    _parallel_runtime_started = True
+    num_rows = len(yd)
+    chunk_rows = chunk_rows or num_rows
+    squared = loss != LossFunction.MAE
+    individuals = np.ascontiguousarray(individuals, dtype=X.dtype)
+    totals = np.zeros(len(individuals))
+    for start in range(0, num_rows, chunk_rows):
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        stop = start + chunk_rows
+        totals += _fused_error_sums(X[start:stop], yd[start:stop], individuals, squared)
+
+    errors = totals / num_rows
+    if loss == LossFunction.RMSE:
+        errors = np.sqrt(errors)
+    return errors
+
+def self_check(rows=2000, features=7, population=13, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(rows, features))
+    yd = X @ rng.normal(size=features) + rng.normal(size=rows)
+    individuals = rng.uniform(-1, 1, size=(population, features + 1))
+    for dtype, tolerance in ((np.float64, 1e-10), (np.float32, 1e-4)):
+        for loss in LossFunction:
+            arrays = X.astype(dtype), yd.astype(dtype), individuals.astype(dtype)
+            reference, _ = batch_errors(*arrays, loss)
+            for chunk_rows in (None, rows // 3):
+                fused = fused_batch_errors(*arrays, loss, chunk_rows)
+                if not np.allclose(fused, reference, rtol=tolerance, atol=0):
+                    logger.warning(
+                        "El kernel compilado difiere de NumPy (%s, %s): %.3e",
+                        np.dtype(dtype).name, loss.value, np.max(np.abs(fused - reference) / reference)
+                    )
+                    return False
+    return True
+
+def resolve_kernel_backend(backend):
+    backend = KernelBackend(backend)
+    if backend == KernelBackend.NUMPY:
+        return backend
+    if numba is None:
+        if backend == KernelBackend.NUMBA:
+            logger.warning("numba no está instalado; se usarán los kernels de NumPy")
+        return KernelBackend.NUMPY
+    if KernelBackend.NUMBA not in _verified_backends:
+        _verified_backends[KernelBackend.NUMBA] = self_check()
+    if not _verified_backends[KernelBackend.NUMBA]:
+        logger.warning("Los kernels compilados no superaron la verificación; se usará NumPy")
+        return KernelBackend.NUMPY
+    return KernelBackend.NUMBA
@@ -0,0 +1,43 @@
+import numpy as np
+from enum import Enum
+
+class LossFunction(Enum):
+    MAE = "mae"
+    MSE = "mse"
+    RMSE = "rmse"
+
+def reduce_errors(error_vector, loss, axis=None):
+    if loss == LossFunction.MAE:
+        return np.abs(error_vector).mean(axis=axis, dtype=np.float64)
+    mse = np.square(error_vector).mean(axis=axis, dtype=np.float64)
+    return np.sqrt(mse) if loss == LossFunction.RMSE else mse
+
+def batch_errors(X, yd, individuals, loss, keep_residuals=False, chunk_rows=None, cancel_token=None):
+    num_rows = len(yd)
+    if not chunk_rows or num_rows <= chunk_rows:
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        yc = np.dot(X, individuals[:, 1:].T) + individuals[:, 0]
+        error_matrix = yd[:, np.newaxis] - yc
+        errors = reduce_errors(error_matrix, loss, axis=0)
+        return errors, (error_matrix.T if keep_residuals else None)
+
+    totals = np.zeros(len(individuals))
+    residuals = np.empty((len(individuals), num_rows), dtype=X.dtype) if keep_residuals else None
+    for start in range(0, num_rows, chunk_rows):
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        stop = start + chunk_rows
+        yc = np.dot(X[start:stop], individuals[:, 1:].T) + individuals[:, 0]
+        error_matrix = yd[start:stop, np.newaxis] - yc
+        if loss == LossFunction.MAE:
+            totals += np.abs(error_matrix).sum(axis=0, dtype=np.float64)
+        else:
+            totals += np.square(error_matrix).sum(axis=0, dtype=np.float64)
+        if keep_residuals:
+            residuals[:, start:stop] = error_matrix.T
+
+    errors = totals / num_rows
+    if loss == LossFunction.RMSE:
+        errors = np.sqrt(errors)
+    return errors, residuals
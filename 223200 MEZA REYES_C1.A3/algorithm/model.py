@@ -0,0 +1,164 @@
+import csv
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from utils.checkpoint import write_checkpoint, read_checkpoint
+
+MODEL_FORMAT_VERSION = 1
+PREDICTION_COLUMN = "Yc"
+
+class RegressionModel:
+    def __init__(self, weights, feature_names=None, normalization=None, loss="mae", fitness=float("nan")):
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.feature_names = None if feature_names is None else [str(name) for name in feature_names]
+        self.normalization = normalization
+        self.loss = loss
+        self.fitness = float(fitness)
+        if self.feature_names is not None and len(self.feature_names) != self.num_features:
+            raise ValueError("El número de nombres de variables no coincide con los pesos del modelo")
+
+    @classmethod
+    def from_algorithm(cls, algorithm, feature_names=None):
+        best_solutions = algorithm.get_best_solutions()
+        if not best_solutions:
+            raise ValueError("El algoritmo no tiene una solución para exportar")
+        fitness, weights = best_solutions[-1]
+        normalization = None
+        if algorithm.scaler is not None:
+            normalization = algorithm.scaler.cache_parameters()
+        return cls(weights, feature_names, normalization, algorithm.loss.value, fitness)
+
+    @classmethod
+    def load(cls, path):
+        data = read_checkpoint(path)
+        if int(data["format_version"]) > MODEL_FORMAT_VERSION:
+            raise ValueError("El modelo fue generado con una versión más reciente del formato")
+        normalization = None
+        if "x_mean" in data:
+            normalization = {
+                "x_mean": data["x_mean"],
+                "x_scale": data["x_scale"],
+                "y_mean": float(data["y_mean"]),
+                "y_scale": float(data["y_scale"]),
+            }
+        feature_names = data["feature_names"].tolist() if "feature_names" in data else None
+        return cls(data["weights"], feature_names, normalization, str(data["loss"]), float(data["fitness"]))
+
+    @property
+    def num_features(self):
+        return len(self.weights) - 1
+
+    def save(self, path):
+        arrays = {
+            "format_version": np.array(MODEL_FORMAT_VERSION),
+            "weights": self.weights,
+            "loss": np.array(self.loss),
+            "fitness": np.array(self.fitness),
+        }
+        if self.feature_names is not None:
+            arrays["feature_names"] = np.array(self.feature_names, dtype=str)
+        if self.normalization is not None:
+            arrays.update({key: np.asarray(value) for key, value in self.normalization.items()})
+        write_checkpoint(path, arrays)
+        return Path(path)
+
+    def predict(self, X):
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != self.num_features:
+            raise ValueError(
+                f"Se esperaban {self.num_features} variables y se recibieron "
+                f"{X.shape[-1] if X.ndim else 0}"
+            )
+        return np.dot(X.astype(np.float64, copy=False), self.weights[1:]) + self.weights[0]
+
+class BatchPredictor:
+    def __init__(self, model, chunk_rows=65536, delimiter=";", id_column="id"):
+        if chunk_rows <= 0:
+            raise ValueError("El tamaño de bloque debe ser mayor que 0")
+        self.model = model
+        self.chunk_rows = int(chunk_rows)
+        self.delimiter = delimiter
+        self.id_column = id_column
+        self.rows = 0
+
+    def feature_columns(self, header):
+        if self.model.feature_names is not None:
+            missing = [name for name in self.model.feature_names if name not in header]
+            if missing:
+                raise ValueError(f"Faltan columnas en el archivo de entrada: {', '.join(missing)}")
+            return list(self.model.feature_names)
+        columns = [name for name in header if name != self.id_column]
+        if len(columns) != self.model.num_features:
+            raise ValueError(
+                "El modelo no tiene nombres de variables y el número de columnas "
+                "no coincide con sus pesos"
+            )
+        return columns
+
+    def iter_csv(self, path):
+        header = pd.read_csv(path, delimiter=self.delimiter, nrows=0).columns.tolist()
+        columns = self.feature_columns(header)
+        id_column = self.id_column if self.id_column in header else None
+        usecols = columns + ([id_column] if id_column is not None else [])
+        reader = pd.read_csv(
+            path, delimiter=self.delimiter, usecols=usecols, chunksize=self.chunk_rows,
+            dtype={name: np.float64 for name in columns}
+        )
+        with reader:
+            for chunk in reader:
+                ids = None if id_column is None else chunk[id_column].to_numpy()
+                yield ids, chunk[columns].to_numpy()
+
+    def iter_array(self, array):
+        for start in range(0, len(array), self.chunk_rows):
+            yield None, array[start:start + self.chunk_rows]
+
+    def iter_chunks(self, source):
+        if isinstance(source, np.ndarray):
+            return self.iter_array(source)
+        if Path(source).suffix == ".npy":
+            return self.iter_array(np.load(source, mmap_mode="r"))
+        return self.iter_csv(source)
+
+    def predict_chunks(self, source):
+        self.rows = 0
+        for ids, features in self.iter_chunks(source):
+            predictions = self.model.predict(features)
+            self.rows += len(predictions)
+            yield ids, predictions
+
+    def predict_to_csv(self, source, output):
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w", newline="") as file:
+            writer = csv.writer(file, delimiter=self.delimiter)
+            header_written = False
+            for ids, predictions in self.predict_chunks(source):
+                if not header_written:
+                    writer.writerow([self.id_column, PREDICTION_COLUMN] if ids is not None else [PREDICTION_COLUMN])
+                    header_written = True
+                if ids is None:
+                    writer.writerows(predictions[:, None].tolist())
+                else:
+                    writer.writerows(zip(ids.tolist(), predictions.tolist()))
+        return self.rows
+
+    def predict_to_npy(self, source, output):
+        if not isinstance(source, np.ndarray) and Path(source).suffix != ".npy":
+            raise ValueError("La salida .npy requiere una entrada .npy o un arreglo en memoria")
+        array = source if isinstance(source, np.ndarray) else np.load(source, mmap_mode="r")
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        predictions = np.lib.format.open_memmap(output, mode="w+", dtype=np.float64, shape=(len(array),))
+        start = 0
+        for _, chunk in self.predict_chunks(array):
+            predictions[start:start + len(chunk)] = chunk
+            start += len(chunk)
+        predictions.flush()
+        del predictions
+        return self.rows
+
+    def predict_file(self, source, output):
+        if Path(output).suffix == ".npy":
+            return self.predict_to_npy(source, output)
+        return self.predict_to_csv(source, output)
@@ -0,0 +1,48 @@
+import numpy as np
+
+class StandardScaler:
+    def __init__(self, X, yd):
+        self.x_mean = X.mean(axis=0)
+        self.x_scale = self._safe_scale(X.std(axis=0))
+        self.y_mean = float(yd.mean())
+        self.y_scale = float(self._safe_scale(np.atleast_1d(yd.std()))[0])
+
+    @classmethod
+    def from_dataset(cls, dataset):
+        return cls(dataset[:, 1:-1], dataset[:, -1])
+
+    @staticmethod
+    def _safe_scale(scale):
+        scale = np.asarray(scale, dtype=float).copy()
+        scale[scale == 0] = 1.0
+        return scale
+
+    def transform_features(self, X):
+        return (X - self.x_mean) / self.x_scale
+
+    def transform_target(self, yd):
+        return (yd - self.y_mean) / self.y_scale
+
+    def inverse_target(self, yd):
+        return yd * self.y_scale + self.y_mean
+
+    def inverse_weights(self, individual):
+        weights = self.y_scale * individual[1:] / self.x_scale
+        bias = self.y_scale * individual[0] + self.y_mean - np.dot(weights, self.x_mean)
+        return np.concatenate(([bias], weights))
+
+    def transform_weights(self, individual):
+        weights = individual[1:] * self.x_scale / self.y_scale
+        bias = (individual[0] - self.y_mean + np.dot(individual[1:], self.x_mean)) / self.y_scale
+        return np.concatenate(([bias], weights))
+
+    def cache_parameters(self):
+        return {
+            "x_mean": self.x_mean,
+            "x_scale": self.x_scale,
+            "y_mean": self.y_mean,
+            "y_scale": self.y_scale,
+        }
+
+    def inverse_fitness(self, fitness, squared=False):
+        return fitness * (self.y_scale ** 2 if squared else self.y_scale)
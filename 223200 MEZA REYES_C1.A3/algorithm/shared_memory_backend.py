@@ -0,0 +1,136 @@
+import weakref
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing import shared_memory
+from utils.cancellation import OperationCancelled
+from utils.concurrency import blas_limit_available, blas_thread_limit, limit_blas_environment
+from .losses import batch_errors
+from .kernels import fused_batch_errors, process_context
+
+_worker_blocks = []
+_worker_arrays = {}
+
+def _share_array(array, blocks):
+    block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    blocks.append(block)
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    shared[...] = array
+    return shared, (block.name, array.shape, array.dtype.str)
+
+def _attach_array(spec):
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    _worker_blocks.append(block)
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+class _EventToken:
+    def __init__(self, event):
+        self.event = event
+
+    def raise_if_cancelled(self):
+        if self.event.is_set():
+            raise OperationCancelled("Operación cancelada")
+
+def _initialize_worker(features_spec, target_spec, residuals_spec, blas_threads, cancel_event):
+    if blas_limit_available():
+        _worker_arrays["blas_limit"] = blas_thread_limit(blas_threads)
+    _worker_arrays["cancel_token"] = _EventToken(cancel_event)
+    _worker_arrays["features"] = _attach_array(features_spec)
+    _worker_arrays["target"] = _attach_array(target_spec)
+    _worker_arrays["residuals"] = None if residuals_spec is None else _attach_array(residuals_spec)
+
+def _evaluate_slice(individuals, start, rows, loss, keep_residuals, chunk_rows=None, fused=False):
+    X = _worker_arrays["features"]
+    yd = _worker_arrays["target"]
+    if rows is not None:
+        X, yd = X[rows], yd[rows]
+    if fused and not keep_residuals:
+        errors = fused_batch_errors(X, yd, individuals, loss, chunk_rows, _worker_arrays["cancel_token"])
+        return start, errors
+    errors, residuals = batch_errors(
+        X, yd, individuals, loss, keep_residuals, chunk_rows, _worker_arrays["cancel_token"]
+    )
+    if keep_residuals:
+        _worker_arrays["residuals"][start:start + len(individuals)] = residuals
+    return start, errors
+
+def _release(executor, blocks):
+    executor.shutdown(wait=True, cancel_futures=True)
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+class SharedMemoryEvaluator:
+    def __init__(self, features, target, loss, num_workers, residual_capacity=0, blas_threads=1,
+                 chunk_rows=None, fused=False):
+        self.loss = loss
+        self.num_workers = num_workers
+        self.blas_threads = blas_threads
+        self.chunk_rows = chunk_rows
+        self.fused = fused
+        context = process_context()
+        if not blas_limit_available():
+            limit_blas_environment(blas_threads)
+            context = multiprocessing.get_context("spawn")
+        self.cancel_event = context.Event()
+        self.residual_capacity = residual_capacity
+        self.blocks = []
+
+        _, features_spec = _share_array(np.ascontiguousarray(features), self.blocks)
+        _, target_spec = _share_array(np.ascontiguousarray(target), self.blocks)
+        self.residuals, residuals_spec = None, None
+        if residual_capacity > 0:
+            self.residuals, residuals_spec = _share_array(
+                np.zeros((residual_capacity, len(target)), dtype=np.asarray(features).dtype), self.blocks
+            )
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(features_spec, target_spec, residuals_spec, blas_threads, self.cancel_event),
+        )
+        self._finalizer = weakref.finalize(self, _release, self.executor, self.blocks)
+
+    def evaluate(self, population, rows=None, keep_residuals=False, batch_size=None,
+                 cancel_token=None):
+        if keep_residuals and len(population) > self.residual_capacity:
+            raise ValueError("La población excede la capacidad de residuos compartidos")
+
+        self.cancel_event.clear()
+        batch_size = batch_size or max(1, len(population) // self.num_workers)
+        pending = {
+            self.executor.submit(
+                _evaluate_slice, population[i:i + batch_size], i, rows, self.loss, keep_residuals,
+                self.chunk_rows, self.fused
+            )
+            for i in range(0, len(population), batch_size)
+        }
+
+        fitness = np.empty(len(population))
+        while pending:
+            done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            if cancel_token is not None and cancel_token.cancelled:
+                self.cancel(pending)
+                cancel_token.raise_if_cancelled()
+            for future in done:
+                start, errors = future.result()
+                fitness[start:start + len(errors)] = errors
+        residuals = self.residuals[:len(population)] if keep_residuals else None
+        return fitness, residuals
+
+    def submit(self, individuals, rows=None):
+        self.cancel_event.clear()
+        return self.executor.submit(
+            _evaluate_slice, individuals, 0, rows, self.loss, False, self.chunk_rows, self.fused
+        )
+
+    def cancel(self, futures=()):
+        self.cancel_event.set()
+        for future in futures:
+            future.cancel()
+        wait(futures)
+
+    def close(self):
+        self._finalizer()
@@ -0,0 +1,26 @@
+import argparse
+from utils.dataset_generator import generate_dataset, write_dataset
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Genera un dataset sintético con formato id;X1..Xn;Y")
+    parser.add_argument("output")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--features", type=int, default=3)
+    parser.add_argument("--noise", type=float, default=50.0)
+    parser.add_argument("--outlier-fraction", type=float, default=0.0)
+    parser.add_argument("--outlier-scale", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args()
+
+def main():
+    arguments = parse_arguments()
+    X, y, weights = generate_dataset(
+        arguments.rows, arguments.features, arguments.noise,
+        arguments.outlier_fraction, arguments.outlier_scale, seed=arguments.seed
+    )
+    write_dataset(arguments.output, X, y)
+    print(f"Dataset guardado en {arguments.output} ({arguments.rows} filas, {arguments.features} variables)")
+    print(f"Pesos reales: {weights.tolist()}")
+
+if __name__ == "__main__":
+    main()
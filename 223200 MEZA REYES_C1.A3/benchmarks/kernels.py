@@ -0,0 +1,56 @@
+import argparse
+import json
+import sys
+import time
+import numpy as np
+from algorithm import kernels
+from algorithm.kernels import KernelBackend, resolve_kernel_backend, fused_batch_errors
+from algorithm.losses import LossFunction, batch_errors
+from utils.dataset_generator import generate_dataset
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Verifica y compara los kernels compilados contra NumPy")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--features", type=int, default=20)
+    parser.add_argument("--population", type=int, default=100)
+    parser.add_argument("--loss", default="mae")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+def best_time(function, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+def main():
+    arguments = parse_arguments()
+    if resolve_kernel_backend(KernelBackend.AUTO) != KernelBackend.NUMBA:
+        print("numba no está disponible o no superó la verificación", file=sys.stderr)
+        sys.exit(0 if kernels.numba is None else 1)
+
+    loss = LossFunction(arguments.loss)
+    X, y, _ = generate_dataset(arguments.rows, arguments.features, seed=arguments.seed)
+    individuals = np.random.default_rng(arguments.seed).uniform(
+        -5, 5, size=(arguments.population, arguments.features + 1)
+    )
+    results = []
+    for dtype in (np.float64, np.float32):
+        arrays = X.astype(dtype), y.astype(dtype), individuals.astype(dtype)
+        fused_batch_errors(*arrays, loss)
+        numpy_time, reference = best_time(lambda: batch_errors(*arrays, loss)[0], arguments.repeats)
+        numba_time, fused = best_time(lambda: fused_batch_errors(*arrays, loss), arguments.repeats)
+        results.append({
+            "dtype": np.dtype(dtype).name,
+            "numpy_seconds": numpy_time,
+            "numba_seconds": numba_time,
+            "speedup": numpy_time / numba_time,
+            "max_relative_difference": float(np.max(np.abs(fused - reference) / np.abs(reference))),
+        })
+    print(json.dumps({"arguments": vars(arguments), "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
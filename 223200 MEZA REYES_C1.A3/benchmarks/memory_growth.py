@@ -0,0 +1,67 @@
+import argparse
+import json
+import random
+import sys
+from algorithm.dataset_genetic_algorithm import GeneticAlgorithm
+from utils.dataset_generator import generate_dataset
+from utils.memory import MemoryTracker
+import numpy as np
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Benchmark de crecimiento de memoria en corridas largas")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--features", type=int, default=5)
+    parser.add_argument("--population", type=int, default=50)
+    parser.add_argument("--generations", type=int, default=500)
+    parser.add_argument("--interval", type=int, default=25)
+    parser.add_argument("--threshold-kib", type=float, default=16.0)
+    parser.add_argument("--backend", default="thread")
+    parser.add_argument("--rss", action="store_true", help="Medir RSS en lugar de tracemalloc")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    return parser.parse_args()
+
+def main():
+    arguments = parse_arguments()
+    random.seed(arguments.seed)
+    X, y, _ = generate_dataset(arguments.rows, arguments.features, seed=arguments.seed)
+    tracker = MemoryTracker(arguments.interval, trace=not arguments.rss)
+
+    algorithm = GeneticAlgorithm(
+        np.column_stack((np.arange(arguments.rows), X, y)), arguments.generations, arguments.population, 0.8, 0.5, -0.5, 0.5,
+        seed=arguments.seed, standardize=True, backend=arguments.backend, memory_tracker=tracker
+    )
+    tracker.sample(0, force=True)
+    try:
+        for _ in range(arguments.generations):
+            algorithm.evolve_population()
+    finally:
+        algorithm.close()
+        tracker.stop()
+
+    report = tracker.report()
+    growth = report["growth_bytes_per_generation"] or 0.0
+    threshold = arguments.threshold_kib * 1024
+    report.update({
+        "arguments": vars(arguments),
+        "threshold_bytes_per_generation": threshold,
+        "passed": growth <= threshold,
+    })
+    output = json.dumps(report, indent=2)
+    if arguments.output is None:
+        print(output)
+    else:
+        with open(arguments.output, "w") as file:
+            file.write(output)
+
+    print(tracker.format_report(), file=sys.stderr)
+    if growth > threshold:
+        print(
+            f"El crecimiento de memoria ({growth / 1024:.2f} KiB/generación) supera el umbral "
+            f"de {arguments.threshold_kib:.2f} KiB/generación",
+            file=sys.stderr
+        )
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
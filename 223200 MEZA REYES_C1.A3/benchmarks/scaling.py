@@ -0,0 +1,150 @@
+import argparse
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+import numpy as np
+from algorithm.dataset_genetic_algorithm import GeneticAlgorithm
+from utils.concurrency import available_cores
+from utils.dataset_generator import generate_dataset
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Benchmark de escalamiento del algoritmo genético")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--features", type=int, nargs="+", default=[3, 20])
+    parser.add_argument("--population", type=int, nargs="+", default=[50])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1])
+    parser.add_argument("--backend", default="thread")
+    parser.add_argument("--loss", default="mae")
+    parser.add_argument("--precision", nargs="+", default=["float64"], choices=["float64", "float32"])
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--time-limit", type=float, default=60.0)
+    parser.add_argument("--target-fitness", type=float, default=None)
+    parser.add_argument("--target-ratio", type=float, default=0.5)
+    parser.add_argument("--noise", type=float, default=50.0)
+    parser.add_argument("--outlier-fraction", type=float, default=0.0)
+    parser.add_argument("--no-standardize", action="store_true")
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--memory-generations", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    return parser.parse_args()
+
+def create_algorithm(dataset, population_size, num_workers, precision, arguments):
+    random.seed(arguments.seed)
+    return GeneticAlgorithm(
+        dataset, arguments.generations, population_size, 0.8, 0.5, -0.5, 0.5,
+        num_workers=num_workers, seed=arguments.seed, loss=arguments.loss,
+        standardize=not arguments.no_standardize, backend=arguments.backend, precision=precision
+    )
+
+def measure_peak_memory(dataset, population_size, num_workers, precision, arguments):
+    tracemalloc.start()
+    try:
+        algorithm = create_algorithm(dataset, population_size, num_workers, precision, arguments)
+        try:
+            for _ in range(min(arguments.memory_generations, arguments.generations)):
+                algorithm.evolve_population()
+        finally:
+            algorithm.close()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_memory
+
+def benchmark_configuration(dataset, population_size, num_workers, precision, arguments):
+    setup_start = time.perf_counter()
+    algorithm = create_algorithm(dataset, population_size, num_workers, precision, arguments)
+    setup_time = time.perf_counter() - setup_start
+
+    target_fitness = arguments.target_fitness
+    time_to_target = None
+    generations = 0
+    start = time.perf_counter()
+    try:
+        while generations < arguments.generations:
+            algorithm.evolve_population()
+            generations += 1
+            elapsed = time.perf_counter() - start
+            best_fitness = algorithm.best_solutions[-1][0]
+            if target_fitness is None:
+                target_fitness = arguments.target_ratio * best_fitness
+            elif time_to_target is None and best_fitness <= target_fitness:
+                time_to_target = elapsed
+            if elapsed > arguments.time_limit:
+                break
+    finally:
+        algorithm.close()
+    elapsed = time.perf_counter() - start
+    drift = algorithm.precision_drift(dataset=dataset)
+
+    peak_memory = None
+    if not arguments.no_memory:
+        peak_memory = measure_peak_memory(dataset, population_size, num_workers, precision, arguments)
+
+    return {
+        "setup_seconds": setup_time,
+        "elapsed_seconds": elapsed,
+        "generations": generations,
+        "evaluations": algorithm.evaluations,
+        "generations_per_second": generations / elapsed,
+        "evaluations_per_second": algorithm.evaluations / elapsed,
+        "best_fitness": float(algorithm.best_solutions[-1][0]),
+        "target_fitness": float(target_fitness),
+        "time_to_target_seconds": time_to_target,
+        "peak_memory_bytes": peak_memory,
+        "fitness_drift": drift,
+    }
+
+def run_benchmarks(arguments):
+    results = []
+    for rows, features in itertools.product(arguments.rows, arguments.features):
+        X, y, _ = generate_dataset(
+            rows, features, arguments.noise, arguments.outlier_fraction, seed=arguments.seed
+        )
+        dataset = np.column_stack((np.arange(rows), X, y))
+        grid = itertools.product(arguments.population, arguments.workers, arguments.precision)
+        for population_size, num_workers, precision in grid:
+            configuration = {
+                "rows": rows,
+                "features": features,
+                "population_size": population_size,
+                "num_workers": num_workers,
+                "precision": precision,
+            }
+            measurement = benchmark_configuration(dataset, population_size, num_workers, precision, arguments)
+            results.append({**configuration, **measurement})
+            print(
+                f"filas={rows} variables={features} población={population_size} "
+                f"workers={num_workers} precisión={precision}: {measurement['generations_per_second']:.2f} gen/s, "
+                f"{measurement['evaluations_per_second']:.0f} eval/s",
+                file=sys.stderr
+            )
+    return results
+
+def main():
+    arguments = parse_arguments()
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "machine": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cores": available_cores(),
+        },
+        "arguments": vars(arguments),
+        "results": run_benchmarks(arguments),
+    }
+    output = json.dumps(report, indent=2)
+    if arguments.output is None:
+        print(output)
+    else:
+        with open(arguments.output, "w") as file:
+            file.write(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import argparse
+import logging
+import sys
+from algorithm.distributed_backend import run_worker
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Trabajador remoto de evaluación de fitness")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--cache-size", type=int, default=2)
+    return parser.parse_args()
+
+def main():
+    arguments = parse_arguments()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    logging.getLogger(__name__).info("Trabajador escuchando en %s:%d", arguments.host, arguments.port)
+    try:
+        run_worker(arguments.host, arguments.port, arguments.cache_size)
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
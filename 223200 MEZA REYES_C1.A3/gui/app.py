@@ -1,18 +1,30 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import pandas as pd
-import numpy as np
 import threading
 import logging
+import os
+import time
+import zipfile
+from datetime import datetime
 from gui.components.buttons import Buttons # type: ignore
 from gui.components.input_fields import InputFields # type: ignore
 from gui.components.plot_canvas import PlotCanvas # type: ignore
 from utils.validation import validate_inputs, format_validation_error # type: ignore
 from algorithm.dataset_genetic_algorithm import GeneticAlgorithm # type: ignore
+from algorithm.preprocessing import StandardScaler # type: ignore
+from utils.cancellation import CancellationToken, OperationCancelled # type: ignore
+from utils.metrics import MetricsSink # type: ignore
+
+CHECKPOINT_PATH = "checkpoints/evolution_checkpoint.npz"
+CHECKPOINT_INTERVAL = 10
+STOP_POLL_INTERVAL_MS = 100
+MODELS_DIRECTORY = "models"
 
 class App(tk.Tk):
-    def __init__(self):
+    def __init__(self, memory_tracker=None):
         super().__init__()
+        self.memory_tracker = memory_tracker
         self.logger = logging.getLogger(__name__)
         self.logger.info("Inicializando aplicación")
         
@@ -50,9 +62,16 @@ class App(tk.Tk):
 
     def setup_variables(self):
         self.dataset = None
+        self.scaler = None
+        self.feature_names = None
         self.algorithm = None
         self.running = False
         self.current_thread = None
+        self.cancel_token = None
+        self.stop_timeout = 5.0
+        self.plot_lock = threading.Lock()
+        self.pending_fitness = []
+        self.refresh_job = None
 
     def connect_events(self):
         self.buttons.parent = self
@@ -61,8 +80,10 @@ class App(tk.Tk):
     def load_dataset(self, filename):
         try:
             data = pd.read_csv(filename, delimiter=';')
+            self.feature_names = data.columns[1:-1].tolist()[1:]
             data = data.to_numpy()
             self.dataset = data[:, 1:]
+            self.scaler = StandardScaler.from_dataset(self.dataset)
             messagebox.showinfo("Éxito", "Dataset cargado correctamente")
             return True
         except Exception as e:
@@ -94,38 +115,75 @@ class App(tk.Tk):
             crossover_rate=params['crossover_rate'],
             mutation_rate=params['mutation_rate'],
             min_interval_mutation_rate=params['min_interval_mutation_rate'],
-            max_interval_mutation_rate=params['max_interval_mutation_rate'] 
+            max_interval_mutation_rate=params['max_interval_mutation_rate'],
+            sample_size=params['sample_size'],
+            scaler=self.scaler if params['standardize'] else None,
+            cancel_token=self.cancel_token,
+            metrics=MetricsSink(f"logs/metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"),
+            checkpoint_path=CHECKPOINT_PATH,
+            checkpoint_interval=CHECKPOINT_INTERVAL,
+            memory_tracker=self.memory_tracker
         )
 
 
-    def update_plots(self, generation, best_fitness, y_pred, y_real):
-        self.plot_canvas.update_fitness_plot(best_fitness)
-        self.plot_canvas.update_prediction_plot(y_pred, y_real)
+    def update_plots(self, fitness_values, y_pred, y_real):
+        self.plot_canvas.update_plots(fitness_values, y_pred, y_real)
+
+    def schedule_plot_refresh(self):
+        if self.refresh_job is None:
+            self.refresh_job = self.after(self.plot_canvas.frame_interval_ms(), self.refresh_plots)
+
+    def refresh_plots(self):
+        self.refresh_job = None
+        with self.plot_lock:
+            fitness_values = self.pending_fitness
+            self.pending_fitness = []
+
+        if fitness_values:
+            self.update_plots(fitness_values, self.algorithm.get_yc(), self.algorithm.get_yd())
+        if self.running:
+            self.schedule_plot_refresh()
 
     def algorithm_worker(self):
         try:
-            gen = 0
+            gen = len(self.algorithm.best_solutions)
             while self.running and gen < self.algorithm.iterations:
-                self.algorithm.evolve_population()
+                self.algorithm.evolve_population(self.cancel_token)
                 best_solution = self.algorithm.best_solutions[-1]
                 
-                y_pred = np.dot(self.algorithm.X, best_solution[1][1:]) + best_solution[1][0]
-                
-                self.after(1, self.update_plots, gen, best_solution[0], y_pred, self.algorithm.yd)
+                with self.plot_lock:
+                    self.pending_fitness.append(best_solution[0])
                 gen += 1
                 
             if self.running:
                 self.after(1, self.on_algorithm_complete)
-                
+
+        except OperationCancelled:
+            self.logger.info("Ejecución cancelada")
         except Exception as e:
-            self.after(1, lambda: messagebox.showerror("Error", f"Error en la ejecución: {str(e)}"))
+            error_message = f"Error en la ejecución: {str(e)}"
+            self.after(1, lambda: messagebox.showerror("Error", error_message))
             self.running = False
+        finally:
+            if self.algorithm.best_solutions:
+                self.algorithm.save_checkpoint()
+            self.algorithm.close()
+            if self.memory_tracker is not None:
+                self.memory_tracker.sample(len(self.algorithm.best_solutions), force=True)
+                self.logger.info(self.memory_tracker.format_report())
 
     def on_file_selected(self, filename):
         if self.load_dataset(filename):
             self.plot_canvas.clear_plots()
 
-    def on_start_algorithm(self):
+    def on_resume_algorithm(self):
+        if not os.path.exists(CHECKPOINT_PATH):
+            messagebox.showerror("Error", "No existe un checkpoint para reanudar")
+            self.buttons.stop_algorithm()
+            return
+        self.on_start_algorithm(resume=True)
+
+    def on_start_algorithm(self, resume=False):
         if self.dataset is None:
             messagebox.showerror("Error", "Por favor, carga un dataset primero")
             return
@@ -134,26 +192,73 @@ class App(tk.Tk):
         if params is None:
             return
 
+        self.cancel_token = CancellationToken()
+        if self.memory_tracker is not None:
+            self.memory_tracker.reset()
         self.algorithm = self.initialize_algorithm(params)
+        if resume:
+            try:
+                self.algorithm.restore_checkpoint()
+            except (ValueError, KeyError, OSError, zipfile.BadZipFile) as e:
+                self.algorithm.close()
+                messagebox.showerror("Error", f"No se pudo reanudar: {str(e)}")
+                self.buttons.stop_algorithm()
+                return
+            self.plot_canvas.clear_plots()
+            with self.plot_lock:
+                self.pending_fitness = [fitness for fitness, _ in self.algorithm.get_best_solutions()]
         self.running = True
+        self.schedule_plot_refresh()
         self.current_thread = threading.Thread(target=self.algorithm_worker, daemon=True)
         self.current_thread.start()
 
-    def on_stop_algorithm(self):
+    def on_stop_algorithm(self, on_stopped=None):
         self.running = False
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
         if self.current_thread and self.current_thread.is_alive():
-            self.current_thread.join(timeout=1.0)
+            self.set_run_buttons_state('disabled')
+        self.wait_for_worker(time.monotonic() + self.stop_timeout, on_stopped)
+
+    def wait_for_worker(self, deadline, on_stopped=None):
+        if self.current_thread and self.current_thread.is_alive():
+            if time.monotonic() < deadline:
+                self.after(STOP_POLL_INTERVAL_MS, self.wait_for_worker, deadline, on_stopped)
+                return
+            self.logger.warning("El hilo del algoritmo no terminó dentro del tiempo límite")
+        self.set_run_buttons_state('normal')
+        if on_stopped is not None:
+            on_stopped()
+
+    def set_run_buttons_state(self, state):
+        for button in (self.buttons.start_btn, self.buttons.resume_btn, self.buttons.upload_btn):
+            button.config(state=state)
+
+    def export_model(self):
+        path = os.path.join(MODELS_DIRECTORY, f"model_{datetime.now().strftime('%Y%m%d_%H%M%S')}.npz")
+        try:
+            self.algorithm.export_model(path, self.feature_names)
+            return path
+        except (OSError, ValueError) as e:
+            self.logger.error(f"No se pudo exportar el modelo: {str(e)}")
+            return None
 
     def on_algorithm_complete(self):
-        messagebox.showinfo("Completado", "El algoritmo ha finalizado su ejecución")
+        self.running = False
+        self.refresh_plots()
+        model_path = self.export_model()
+        message = "El algoritmo ha finalizado su ejecución"
+        if model_path is not None:
+            message += f"\nModelo guardado en {model_path}"
+        messagebox.showinfo("Completado", message)
         self.buttons.start_btn.config(state='normal')
+        self.buttons.resume_btn.config(state='normal')
         self.buttons.stop_btn.config(state='disabled')
 
     def on_closing(self):        
         if messagebox.askokcancel("Salir", "¿Deseas cerrar la aplicación?"):
             self.logger.info("Cerrando aplicación")
-            self.on_stop_algorithm()
-            self.quit()
+            self.on_stop_algorithm(on_stopped=self.quit)
 
     def show_error(self, message):        
         self.logger.error(message)
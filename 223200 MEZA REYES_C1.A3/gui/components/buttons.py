@@ -27,6 +27,14 @@ class Buttons:
         )
         self.start_btn.pack(side=tk.LEFT, padx=5, pady=5)
                 
+        self.resume_btn = ttk.Button(
+            self.frame,
+            text="Reanudar",
+            command=self.resume_algorithm,
+            style=self.action_button
+        )
+        self.resume_btn.pack(side=tk.LEFT, padx=5, pady=5)
+                
         self.stop_btn = ttk.Button(
             self.frame,
             text="Detener",
@@ -54,8 +62,17 @@ class Buttons:
             if hasattr(self.parent, 'on_file_selected'):
                 self.parent.on_file_selected(filename)
     
+    def resume_algorithm(self):
+        self.start_btn.config(state='disabled')
+        self.resume_btn.config(state='disabled')
+        self.stop_btn.config(state='normal')
+        self.upload_btn.config(state='disabled')        
+        if hasattr(self.parent, 'on_resume_algorithm'):
+            self.parent.on_resume_algorithm()
+    
     def start_algorithm(self):
         self.start_btn.config(state='disabled')
+        self.resume_btn.config(state='disabled')
         self.stop_btn.config(state='normal')
         self.upload_btn.config(state='disabled')        
         if hasattr(self.parent, 'on_start_algorithm'):
@@ -63,6 +80,7 @@ class Buttons:
     
     def stop_algorithm(self):
         self.start_btn.config(state='normal')
+        self.resume_btn.config(state='normal')
         self.stop_btn.config(state='disabled')
         self.upload_btn.config(state='normal')        
         if hasattr(self.parent, 'on_stop_algorithm'):
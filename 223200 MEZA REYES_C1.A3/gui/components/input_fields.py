@@ -29,6 +29,10 @@ class InputFields:
             'max_interval_mutation_rate': {
                 'label': 'Intervalo Máx. Mutación:',
                 'default': '0.5'
+            },
+            'sample_size': {
+                'label': 'Muestra de Filas (fracción o n):',
+                'default': '1'
             }
         }
         
@@ -49,6 +53,14 @@ class InputFields:
             entry.pack(side=tk.RIGHT)
             
             self.fields[field_name] = entry
+
+        self.standardize_var = tk.BooleanVar(value=False)
+        standardize_check = ttk.Checkbutton(
+            self.frame,
+            text='Estandarizar datos',
+            variable=self.standardize_var
+        )
+        standardize_check.pack(anchor=tk.W, padx=5, pady=2)
     
     def validate_float(self, value):
         if value == "":
@@ -70,10 +82,12 @@ class InputFields:
         return self.frame
     
     def get_values(self):
-        return {
+        values = {
             name: float(field.get())
             for name, field in self.fields.items()
         }
+        values['standardize'] = self.standardize_var.get()
+        return values
     
     def set_values(self, values_dict):
         for name, value in values_dict.items():
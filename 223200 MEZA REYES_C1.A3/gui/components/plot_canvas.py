@@ -4,9 +4,10 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import numpy as np
+from utils.downsampling import DOWNSAMPLERS # type: ignore
 
 class PlotCanvas:
-    def __init__(self, parent):
+    def __init__(self, parent, max_fps=20, downsampling="minmax"):
         self.evo_fit = "Evolución del Fitness"
         self.gen = "Generación"
         self.best = "Mejor Fitness"
@@ -16,69 +17,166 @@ class PlotCanvas:
 
         self.parent = parent
         self.frame = ttk.Frame(parent)
-        
+        self.max_fps = max_fps
+        self.downsample = DOWNSAMPLERS[downsampling]
+        self.points_per_pixel = 2 if downsampling == "minmax" else 1
+
         self.figure = Figure(figsize=(10, 4), dpi=100)
         self.fitness_ax = self.figure.add_subplot(121)
         self.prediction_ax = self.figure.add_subplot(122)
-        
-        self.fitness_ax.set_title(self.evo_fit)
-        self.fitness_ax.set_xlabel(self.gen)
-        self.fitness_ax.set_ylabel(self.best)
-        
-        self.prediction_ax.set_title(self.versus)
-        self.prediction_ax.set_xlabel(self.index)
-        self.prediction_ax.set_ylabel(self.val)
-        
+        self.setup_axes()
+
+        self.fitness_line, = self.fitness_ax.plot([], [], 'b-', animated=True)
+        self.real_line, = self.prediction_ax.plot([], [], 'b-', label='Real', animated=True)
+        self.prediction_line, = self.prediction_ax.plot([], [], 'r--', label='Predicción', animated=True)
+        self.prediction_ax.legend()
+        self.artists = {
+            self.fitness_ax: [self.fitness_line],
+            self.prediction_ax: [self.real_line, self.prediction_line],
+        }
+
         self.canvas = FigureCanvasTkAgg(self.figure, master=self.frame)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        self.backgrounds = {}
+        self.dirty_axes = set()
+        self.canvas.mpl_connect('draw_event', self.on_draw)
 
         self.fitness_data = []
+        self.fitness_min = np.inf
+        self.fitness_max = -np.inf
         self.prediction_data = None
         self.real_data = None
-        
-    def update_fitness_plot(self, fitness_value):
-        self.fitness_data.append(fitness_value)
-        self.fitness_ax.clear()
+        self.real_points = None
+
+    def setup_axes(self):
         self.fitness_ax.set_title(self.evo_fit)
         self.fitness_ax.set_xlabel(self.gen)
         self.fitness_ax.set_ylabel(self.best)
-        self.fitness_ax.plot(self.fitness_data, 'b-')
-        self.canvas.draw()
-    
-    def update_prediction_plot(self, y_pred, y_real):
-        self.prediction_data = y_pred
-        self.real_data = y_real
-        
-        self.prediction_ax.clear()
+
         self.prediction_ax.set_title(self.versus)
         self.prediction_ax.set_xlabel(self.index)
         self.prediction_ax.set_ylabel(self.val)
-        
-        indices = np.arange(len(y_real))
-        self.prediction_ax.plot(indices, y_real, 'b-', label='Real')
-        self.prediction_ax.plot(indices, y_pred, 'r--', label='Predicción')
-        self.prediction_ax.legend()
-        
-        self.canvas.draw()
-    
+
+    def frame_interval_ms(self):
+        return max(1, int(1000 / self.max_fps))
+
+    def target_points(self, ax):
+        return max(100, int(ax.bbox.width) * self.points_per_pixel)
+
+    def set_downsampled_data(self, line, y, num_points):
+        indices = self.downsample(y, num_points)
+        line.set_data(indices, np.asarray(y)[indices])
+
+    def on_draw(self, event):
+        self.backgrounds = {
+            ax: self.canvas.copy_from_bbox(ax.bbox) for ax in self.artists
+        }
+        for ax, artists in self.artists.items():
+            for artist in artists:
+                ax.draw_artist(artist)
+
+    def blit_axes(self, axes):
+        if any(ax not in self.backgrounds for ax in axes):
+            self.canvas.draw()
+            return
+        for ax in axes:
+            self.canvas.restore_region(self.backgrounds[ax])
+            for artist in self.artists[ax]:
+                ax.draw_artist(artist)
+            self.canvas.blit(ax.bbox)
+
+    def refresh(self, redraw):
+        if redraw:
+            self.canvas.draw()
+        elif self.dirty_axes:
+            self.blit_axes([ax for ax in self.artists if ax in self.dirty_axes])
+        self.dirty_axes.clear()
+
+    def expand_limits(self, ax, x_max, y_min, y_max):
+        _, x_high = ax.get_xlim()
+        y_low, y_high = ax.get_ylim()
+        changed = False
+
+        if x_max > x_high:
+            ax.set_xlim(0, max(10, 2 * x_max))
+            changed = True
+        if y_min < y_low or y_max > y_high:
+            margin = 0.05 * (y_max - y_min) or 1.0
+            ax.set_ylim(y_min - margin, y_max + margin)
+            changed = True
+        return changed
+
+    def extend_fitness_data(self, fitness_values):
+        if not fitness_values:
+            return False
+        self.dirty_axes.add(self.fitness_ax)
+        self.fitness_data.extend(fitness_values)
+        self.fitness_min = min(self.fitness_min, min(fitness_values))
+        self.fitness_max = max(self.fitness_max, max(fitness_values))
+        self.set_downsampled_data(
+            self.fitness_line, self.fitness_data, self.target_points(self.fitness_ax)
+        )
+        return self.expand_limits(
+            self.fitness_ax, len(self.fitness_data) - 1, self.fitness_min, self.fitness_max
+        )
+
+    def set_prediction_data(self, y_pred, y_real):
+        changed = False
+        num_points = self.target_points(self.prediction_ax)
+        if (y_pred is self.prediction_data and y_real is self.real_data
+                and num_points == self.real_points):
+            return False
+        self.dirty_axes.add(self.prediction_ax)
+        if y_real is not self.real_data:
+            self.real_data = y_real
+            self.real_points = None
+            self.prediction_ax.set_xlim(0, max(1, len(y_real) - 1))
+            self.prediction_ax.set_ylim(np.min(y_real), np.max(y_real))
+            changed = True
+        if self.real_points != num_points:
+            self.real_points = num_points
+            self.set_downsampled_data(self.real_line, y_real, num_points)
+
+        self.prediction_data = y_pred
+        self.set_downsampled_data(self.prediction_line, y_pred, num_points)
+        y_low, y_high = self.prediction_ax.get_ylim()
+        pred_min, pred_max = np.min(y_pred), np.max(y_pred)
+        if pred_min < y_low or pred_max > y_high:
+            margin = 0.05 * (max(pred_max, y_high) - min(pred_min, y_low))
+            self.prediction_ax.set_ylim(min(pred_min, y_low) - margin, max(pred_max, y_high) + margin)
+            changed = True
+        return changed
+
+    def update_plots(self, fitness_values, y_pred, y_real):
+        fitness_changed = self.extend_fitness_data(fitness_values)
+        prediction_changed = self.set_prediction_data(y_pred, y_real)
+        self.refresh(fitness_changed or prediction_changed)
+
+    def update_fitness_plot(self, fitness_value):
+        self.refresh(self.extend_fitness_data([fitness_value]))
+
+    def update_prediction_plot(self, y_pred, y_real):
+        self.refresh(self.set_prediction_data(y_pred, y_real))
+
     def clear_plots(self):
         self.fitness_data = []
+        self.fitness_min = np.inf
+        self.fitness_max = -np.inf
         self.prediction_data = None
         self.real_data = None
-        
-        self.fitness_ax.clear()
-        self.prediction_ax.clear()
-        
-        self.fitness_ax.set_title(self.evo_fit)
-        self.fitness_ax.set_xlabel(self.gen)
-        self.fitness_ax.set_ylabel(self.best)
-        
-        self.prediction_ax.set_title(self.versus)
-        self.prediction_ax.set_xlabel(self.index)
-        self.prediction_ax.set_ylabel(self.val)
-        
+        self.real_points = None
+        self.dirty_axes.clear()
+
+        for artists in self.artists.values():
+            for artist in artists:
+                artist.set_data([], [])
+        self.fitness_ax.set_xlim(0, 1)
+        self.fitness_ax.set_ylim(0, 1)
+        self.prediction_ax.set_xlim(0, 1)
+        self.prediction_ax.set_ylim(0, 1)
+
         self.canvas.draw()
-    
+
     def get_frame(self):
-        return self.frame
\ No newline at end of file
+        return self.frame
@@ -1,9 +1,14 @@
 import sys
+import argparse
 import traceback
 import logging
+import atexit
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from datetime import datetime
 from pathlib import Path
 from gui.app import App
+from utils.memory import MemoryTracker
 
 def setup_logging():
     log_dir = Path("logs")
@@ -12,23 +17,34 @@ def setup_logging():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f"app_{timestamp}.log"
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
     
     return logging.getLogger(__name__)
 
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Algoritmo Genético - Regresión Lineal")
+    parser.add_argument("--memory", action="store_true", help="Registrar el uso de memoria por generación")
+    parser.add_argument("--memory-interval", type=int, default=10)
+    return parser.parse_args()
+
 def run_application():
+    arguments = parse_arguments()
     logger = setup_logging()
     logger.info("Iniciando aplicación")
     
     try:        
-        app = App()
+        memory_tracker = MemoryTracker(arguments.memory_interval) if arguments.memory else None
+        app = App(memory_tracker=memory_tracker)
                 
         def handle_exception(exc_type, exc_value, exc_traceback):
             if issubclass(exc_type, KeyboardInterrupt):
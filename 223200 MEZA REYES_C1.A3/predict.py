@@ -0,0 +1,34 @@
+import argparse
+import logging
+import sys
+import time
+from algorithm.model import RegressionModel, BatchPredictor
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Aplica un modelo exportado a un archivo CSV o .npy por bloques")
+    parser.add_argument("model")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--chunk-rows", type=int, default=65536)
+    parser.add_argument("--delimiter", default=";")
+    parser.add_argument("--id-column", default="id")
+    return parser.parse_args()
+
+def main():
+    arguments = parse_arguments()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    logger = logging.getLogger(__name__)
+    model = RegressionModel.load(arguments.model)
+    predictor = BatchPredictor(model, arguments.chunk_rows, arguments.delimiter, arguments.id_column)
+
+    start = time.perf_counter()
+    rows = predictor.predict_file(arguments.input, arguments.output)
+    elapsed = time.perf_counter() - start
+    logger.info("%d predicciones guardadas en %s (%.2f s)", rows, arguments.output, elapsed)
+
+if __name__ == "__main__":
+    main()
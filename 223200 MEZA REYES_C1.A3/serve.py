@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+import logging
+import sys
+from service.server import JobService
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Servicio local de ejecución de algoritmos genéticos")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-queued", type=int, default=64)
+    parser.add_argument("--cache-directory", default=".cache/results")
+    parser.add_argument("--no-cache", action="store_true", help="No reutilizar resultados de trabajos con semilla")
+    return parser.parse_args()
+
+def main():
+    arguments = parse_arguments()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    service = JobService(
+        max_workers=arguments.workers, max_queued=arguments.max_queued,
+        cache_directory=None if arguments.no_cache else arguments.cache_directory
+    )
+    try:
+        asyncio.run(service.serve_forever(arguments.host, arguments.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
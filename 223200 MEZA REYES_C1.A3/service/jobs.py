@@ -0,0 +1,131 @@
+import random
+import sys
+from enum import Enum
+from pathlib import Path
+import numpy as np
+
+DATASET_PROJECT = Path(__file__).resolve().parents[1]
+FUNCTION_PROJECT = DATASET_PROJECT.parent / "223200 MEZA REYES_C1.A2"
+
+class Engine(Enum):
+    FUNCTION = "a2"
+    DATASET = "a3"
+
+def use_project(root):
+    root = str(root)
+    if root in sys.path:
+        sys.path.remove(root)
+    sys.path.insert(0, root)
+
+def report(events, job_id, event_type, **payload):
+    events.put((job_id, {"type": event_type, **payload}))
+
+def load_dataset(path):
+    import pandas as pd
+    return pd.read_csv(path, delimiter=';').to_numpy()[:, 1:]
+
+def create_result_cache(cache_directory):
+    if cache_directory is None:
+        return None
+    from utils.result_cache import ResultCache
+    return ResultCache(cache_directory)
+
+def run_dataset_job(job_id, params, events, cancel_event, cache_directory=None):
+    use_project(DATASET_PROJECT)
+    from algorithm.dataset_genetic_algorithm import GeneticAlgorithm
+    from utils.cancellation import CancellationToken, OperationCancelled
+
+    params = dict(params)
+    dataset = load_dataset(params.pop("dataset"))
+    if params.get("seed") is not None:
+        random.seed(params["seed"])
+    algorithm = GeneticAlgorithm(
+        dataset, cancel_token=CancellationToken(cancel_event),
+        result_cache=create_result_cache(cache_directory), **params
+    )
+    report(events, job_id, "status", status="running")
+
+    status = "completed"
+    key = algorithm.cache_key()
+    cached = key is not None and algorithm.load_cached_result(key)
+    try:
+        for _ in range(0 if cached else algorithm.iterations):
+            algorithm.evolve_population()
+            report(
+                events, job_id, "progress",
+                generation=len(algorithm.best_solutions),
+                best_fitness=float(algorithm.best_solutions[-1][0]),
+            )
+    except OperationCancelled:
+        status = "cancelled"
+    finally:
+        algorithm.close()
+    if key is not None and not cached and status == "completed":
+        algorithm.store_cached_result(key)
+
+    if not algorithm.best_solutions:
+        return {"status": status, "generations": 0, "cached": cached}
+    best_fitness, best_weights = algorithm.best_solutions[-1]
+    return {
+        "status": status,
+        "cached": cached,
+        "generations": len(algorithm.best_solutions),
+        "best_fitness": float(best_fitness),
+        "best_weights": np.asarray(best_weights).tolist(),
+        "evaluations": algorithm.evaluations,
+    }
+
+def run_function_job(job_id, params, events, cancel_event, cache_directory=None):
+    use_project(FUNCTION_PROJECT)
+    from algorithm.genetic_algorithm import (
+        GeneticAlgorithm, PairingStrategy, CrossoverStrategy, MutationStrategy, PruningStrategy
+    )
+
+    params = dict(params)
+    strategies = {
+        "pairing_strategy": PairingStrategy,
+        "crossover_strategy": CrossoverStrategy,
+        "mutation_strategy": MutationStrategy,
+        "pruning_strategy": PruningStrategy,
+    }
+    for key, strategy in strategies.items():
+        if key in params:
+            params[key] = strategy(params[key])
+    algorithm = GeneticAlgorithm(result_cache=create_result_cache(cache_directory), **params)
+    key = algorithm.cache_key()
+    cached = key is not None and algorithm.load_cached_result(key)
+    if not cached:
+        algorithm.initialize_population()
+    report(events, job_id, "status", status="running")
+
+    status = "completed"
+    try:
+        for i in range(algorithm.generation, int(algorithm.iteration)):
+            if cancel_event.is_set():
+                status = "cancelled"
+                break
+            algorithm.evolve(i)
+            report(
+                events, job_id, "progress",
+                generation=algorithm.generation,
+                best_fitness=float(algorithm.best_fitness),
+                best_x=float(algorithm.best_x),
+            )
+    finally:
+        algorithm.close()
+    if key is not None and not cached and status == "completed":
+        algorithm.store_cached_result(key)
+
+    return {
+        "status": status,
+        "cached": cached,
+        "generations": algorithm.generation,
+        "best_fitness": float(algorithm.best_fitness),
+        "best_x": None if algorithm.best_x is None else float(algorithm.best_x),
+        "best_binary": None if algorithm.best_solution is None else algorithm.best_solution.binary,
+    }
+
+RUNNERS = {
+    Engine.FUNCTION: run_function_job,
+    Engine.DATASET: run_dataset_job,
+}
@@ -0,0 +1,254 @@
+import asyncio
+import json
+import logging
+import signal
+import threading
+import uuid
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, CancelledError
+from http import HTTPStatus
+from utils.concurrency import available_cores
+from .jobs import Engine, RUNNERS
+
+FINISHED_STATUSES = ("completed", "cancelled", "failed")
+
+class ServiceError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class Job:
+    def __init__(self, engine, params, cancel_event):
+        self.id = uuid.uuid4().hex[:12]
+        self.engine = engine
+        self.params = params
+        self.cancel_event = cancel_event
+        self.status = "queued"
+        self.result = None
+        self.error = None
+        self.future = None
+        self.events = []
+        self.subscribers = set()
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "engine": self.engine.value,
+            "status": self.status,
+            "generations": len([event for event in self.events if event["type"] == "progress"]),
+            "result": self.result,
+            "error": self.error,
+        }
+
+class JobService:
+    def __init__(self, max_workers=None, max_queued=64, cache_directory=None):
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers or available_cores()
+        self.max_queued = max_queued
+        self.cache_directory = None if cache_directory is None else str(cache_directory)
+        context = mp.get_context("spawn")
+        self.manager = context.Manager()
+        self.event_queue = self.manager.Queue()
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=context, max_tasks_per_child=1
+        )
+        self.jobs = {}
+        self.loop = None
+        self.server = None
+        self.event_thread = None
+
+    async def start(self, host="127.0.0.1", port=8765):
+        self.loop = asyncio.get_running_loop()
+        self.event_thread = threading.Thread(target=self.forward_events, daemon=True)
+        self.event_thread.start()
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        self.logger.info("Servicio de trabajos escuchando en %s:%d", host, port)
+        return self.server
+
+    async def serve_forever(self, host="127.0.0.1", port=8765):
+        await self.start(host, port)
+        stop = asyncio.Event()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self.loop.add_signal_handler(signal_number, stop.set)
+            except NotImplementedError:
+                pass
+        try:
+            await stop.wait()
+        finally:
+            self.server.close()
+            self.close()
+            self.logger.info("Servicio de trabajos detenido")
+
+    def close(self):
+        for job in self.jobs.values():
+            if not job.finished:
+                job.cancel_event.set()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.event_queue.put(None)
+        if self.event_thread is not None:
+            self.event_thread.join()
+        self.manager.shutdown()
+
+    def forward_events(self):
+        while True:
+            item = self.event_queue.get()
+            if item is None:
+                break
+            self.loop.call_soon_threadsafe(self.publish, *item)
+
+    def publish(self, job_id, event):
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return
+        if event["type"] == "status":
+            job.status = event["status"]
+        job.events.append(event)
+        for subscriber in job.subscribers:
+            subscriber.put_nowait(event)
+            if job.finished:
+                subscriber.put_nowait(None)
+
+    def limit_workers(self, params):
+        share = max(1, available_cores() // self.max_workers)
+        requested = params.get("num_workers") or share
+        return {**params, "num_workers": max(1, min(int(requested), share))}
+
+    def submit(self, engine, params):
+        try:
+            engine = Engine(engine)
+        except ValueError:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, f"Motor desconocido: {engine}")
+        if not isinstance(params, dict):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Los parámetros deben ser un objeto JSON")
+        if engine == Engine.DATASET:
+            params = self.limit_workers(params)
+        active = sum(not job.finished for job in self.jobs.values())
+        if active >= self.max_queued:
+            raise ServiceError(HTTPStatus.SERVICE_UNAVAILABLE, "La cola de trabajos está llena")
+
+        job = Job(engine, params, self.manager.Event())
+        self.jobs[job.id] = job
+        job.future = self.executor.submit(
+            RUNNERS[engine], job.id, params, self.event_queue, job.cancel_event, self.cache_directory
+        )
+        asyncio.ensure_future(self.watch(job))
+        self.logger.info("Trabajo %s (%s) encolado", job.id, engine.value)
+        return job
+
+    async def watch(self, job):
+        try:
+            job.result = await asyncio.wrap_future(job.future)
+            status = job.result["status"]
+        except CancelledError:
+            status = "cancelled"
+        except Exception as e:
+            job.error = str(e)
+            status = "failed"
+        await self.loop.run_in_executor(
+            None, self.event_queue.put, (job.id, {"type": "status", "status": status})
+        )
+        self.logger.info("Trabajo %s finalizado: %s", job.id, status)
+
+    def cancel(self, job):
+        if job.finished:
+            return
+        job.cancel_event.set()
+        job.future.cancel()
+
+    def get_job(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise ServiceError(HTTPStatus.NOT_FOUND, f"Trabajo no encontrado: {job_id}")
+        return job
+
+    async def read_request(self, reader):
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        if not request_line:
+            return None
+        method, target, _ = request_line.split(" ", 2)
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target.split("?", 1)[0].rstrip("/"), body
+
+    async def send_json(self, writer, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+
+    async def stream_events(self, writer, job):
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/x-ndjson\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        subscriber = asyncio.Queue()
+        backlog = list(job.events)
+        subscribed = not job.finished
+        if subscribed:
+            job.subscribers.add(subscriber)
+        try:
+            for event in backlog:
+                writer.write(json.dumps(event).encode("utf-8") + b"\n")
+            await writer.drain()
+            while subscribed:
+                event = await subscriber.get()
+                if event is None:
+                    break
+                writer.write(json.dumps(event).encode("utf-8") + b"\n")
+                await writer.drain()
+            writer.write(json.dumps({"type": "result", **job.to_dict()}).encode("utf-8") + b"\n")
+            await writer.drain()
+        finally:
+            job.subscribers.discard(subscriber)
+
+    async def route(self, writer, method, path, body):
+        parts = [part for part in path.split("/") if part]
+        if parts == ["jobs"] and method == "GET":
+            return await self.send_json(writer, HTTPStatus.OK, [job.to_dict() for job in self.jobs.values()])
+        if parts == ["jobs"] and method == "POST":
+            request = json.loads(body or b"{}")
+            if not isinstance(request, dict):
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "El cuerpo de la solicitud debe ser un objeto JSON")
+            job = self.submit(request.get("engine"), request.get("params", {}))
+            return await self.send_json(writer, HTTPStatus.ACCEPTED, job.to_dict())
+        if len(parts) == 2 and parts[0] == "jobs":
+            job = self.get_job(parts[1])
+            if method == "GET":
+                return await self.send_json(writer, HTTPStatus.OK, job.to_dict())
+            if method == "DELETE":
+                self.cancel(job)
+                return await self.send_json(writer, HTTPStatus.ACCEPTED, job.to_dict())
+        if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "events" and method == "GET":
+            return await self.stream_events(writer, self.get_job(parts[1]))
+        raise ServiceError(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {method} {path}")
+
+    async def handle_client(self, reader, writer):
+        try:
+            request = await self.read_request(reader)
+            if request is not None:
+                await self.route(writer, *request)
+        except ServiceError as e:
+            await self.send_json(writer, e.status, {"error": str(e)})
+        except (ValueError, json.JSONDecodeError, asyncio.IncompleteReadError) as e:
+            await self.send_json(writer, HTTPStatus.BAD_REQUEST, {"error": f"Solicitud inválida: {str(e)}"})
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,36 @@
+import os
+import time
+import numpy as np
+import pytest
+from algorithm.losses import LossFunction
+from algorithm.shared_memory_backend import SharedMemoryEvaluator
+from utils.concurrency import ConcurrencyConfig, blas_limit_available
+
+def read_blas_environment(_):
+    return os.environ.get("OPENBLAS_NUM_THREADS")
+
+def test_calibration_excludes_startup_cost():
+    started = set()
+
+    def evaluate(num_workers, batch_size, blas_threads):
+        if num_workers not in started:
+            started.add(num_workers)
+            time.sleep(0.2 * num_workers)
+        time.sleep(0.001 * batch_size / num_workers)
+
+    config = ConcurrencyConfig(num_workers=1)
+    config.cores = 4
+    best = config.calibrate(evaluate, 16, worker_options=[1, 4], repeats=1)
+    assert best[0] == 4
+
+@pytest.mark.skipif(blas_limit_available(), reason="threadpoolctl limita BLAS directamente")
+def test_process_workers_start_with_blas_environment():
+    rng = np.random.default_rng(0)
+    evaluator = SharedMemoryEvaluator(
+        rng.normal(size=(50, 3)), rng.normal(size=50), LossFunction.MAE, 1, blas_threads=1
+    )
+    try:
+        assert evaluator.executor._mp_context.get_start_method() == "spawn"
+        assert evaluator.executor.submit(read_blas_environment, None).result(timeout=60) == "1"
+    finally:
+        evaluator.close()
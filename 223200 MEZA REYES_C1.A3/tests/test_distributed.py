@@ -0,0 +1,68 @@
+import socket
+import threading
+import time
+import numpy as np
+import pytest
+from algorithm.distributed_backend import DistributedEvaluator, EvaluationServer
+from algorithm.losses import LossFunction, batch_errors
+
+def make_dataset(seed):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(200, 3))
+    return X, X @ np.arange(1, 4) + seed
+
+@pytest.fixture
+def worker():
+    def start(port=0, cache_size=1):
+        server = EvaluationServer(("127.0.0.1", port), cache_size)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server.server_address
+    servers = []
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def test_evicted_dataset_is_sent_again(worker):
+    address = worker(cache_size=1)
+    individuals = np.random.default_rng(0).uniform(-1, 1, size=(6, 4))
+    datasets = [make_dataset(1), make_dataset(2)]
+    evaluators = [DistributedEvaluator(X, yd, LossFunction.MSE, [address]) for X, yd in datasets]
+    try:
+        for _ in range(2):
+            for evaluator, (X, yd) in zip(evaluators, datasets):
+                fitness, _ = evaluator.evaluate(individuals)
+                expected, _ = batch_errors(X, yd, individuals, LossFunction.MSE)
+                np.testing.assert_allclose(fitness, expected)
+    finally:
+        for evaluator in evaluators:
+            evaluator.close()
+
+def test_worker_reconnects_after_being_dropped(worker):
+    port = free_port()
+    X, yd = make_dataset(1)
+    evaluator = DistributedEvaluator(
+        X, yd, LossFunction.MAE, [("127.0.0.1", port)], max_failures=1, max_backoff=0.2
+    )
+    try:
+        deadline = time.monotonic() + 5
+        while evaluator.live_connections and time.monotonic() < deadline:
+            time.sleep(0.05)
+        with pytest.raises(ConnectionError):
+            evaluator.submit(np.zeros((1, 4)))
+
+        worker(port=port)
+        while not evaluator.live_connections and time.monotonic() < deadline + 5:
+            time.sleep(0.05)
+        individuals = np.ones((2, 4))
+        fitness, _ = evaluator.evaluate(individuals)
+        expected, _ = batch_errors(X, yd, individuals, LossFunction.MAE)
+        np.testing.assert_allclose(fitness, expected)
+    finally:
+        evaluator.close()
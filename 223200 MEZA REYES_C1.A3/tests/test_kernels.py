@@ -0,0 +1,59 @@
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+import numpy as np
+import pytest
+from algorithm import kernels
+from algorithm.kernels import KernelBackend, resolve_kernel_backend, fused_batch_errors
+from algorithm.losses import LossFunction, batch_errors
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+def run_script(script, timeout=120):
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(script)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=timeout
+    )
+
+def test_numpy_backend_does_not_require_numba():
+    assert resolve_kernel_backend(KernelBackend.NUMPY) == KernelBackend.NUMPY
+
+@pytest.mark.parametrize("loss", list(LossFunction))
+@pytest.mark.parametrize("dtype, tolerance", [(np.float64, 1e-10), (np.float32, 1e-4)])
+def test_fused_kernel_matches_numpy(loss, dtype, tolerance):
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(500, 4)).astype(dtype)
+    yd = (X @ np.arange(1, 5) + 1).astype(dtype)
+    individuals = rng.uniform(-1, 1, size=(9, 5)).astype(dtype)
+    reference, _ = batch_errors(X, yd, individuals, loss)
+    for chunk_rows in (None, 120):
+        fused = fused_batch_errors(X, yd, individuals, loss, chunk_rows)
+        np.testing.assert_allclose(fused, reference, rtol=tolerance)
+    assert kernels.process_context().get_start_method() == "spawn"
+
+def test_process_backend_with_numba_exits_cleanly():
+    pytest.importorskip("numba")
+    completed = run_script("""
+        import numpy as np
+        from algorithm.dataset_genetic_algorithm import GeneticAlgorithm
+        from algorithm.distributed_backend import start_local_workers
+
+        if __name__ == "__main__":
+            rng = np.random.default_rng(0)
+            X = rng.normal(size=(2000, 4))
+            dataset = np.column_stack((np.arange(2000), X, X @ [1, 2, 3, 4] + 1))
+            algorithm = GeneticAlgorithm(
+                dataset, 3, 12, 0.8, 0.5, -0.5, 0.5, seed=1, backend="process",
+                num_workers=2, kernel_backend="numba"
+            )
+            print(algorithm.run() is not None)
+            processes, addresses = start_local_workers(1)
+            print(len(addresses))
+            for process in processes:
+                process.terminate()
+                process.join()
+    """)
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.split() == ["True", "1"]
@@ -0,0 +1,12 @@
+import numpy as np
+import pytest
+from utils.metrics import MetricsSink, load_metrics
+
+def test_append_after_close_raises(tmp_path):
+    sink = MetricsSink(tmp_path / "metrics.csv", columns=("generation", "best"), capacity=4)
+    sink.append(0, 1.5)
+    sink.close()
+    with pytest.raises(ValueError):
+        sink.append(1, 1.2)
+    assert sink.rows_written == 1
+    assert np.atleast_1d(load_metrics(sink.path)["best"]).tolist() == [1.5]
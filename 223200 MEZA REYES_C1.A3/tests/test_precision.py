@@ -0,0 +1,16 @@
+import numpy as np
+import pytest
+from algorithm.dataset_genetic_algorithm import GeneticAlgorithm
+
+@pytest.mark.parametrize("precision", ["float64", "float32"])
+@pytest.mark.parametrize("standardize", [False, True])
+def test_get_yd_returns_the_same_array(precision, standardize):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(50, 2))
+    dataset = np.column_stack((np.arange(50), X, X @ [3, -2] + 5))
+    algorithm = GeneticAlgorithm(
+        dataset, 1, 4, 0.8, 0.5, -0.5, 0.5, seed=0, precision=precision, standardize=standardize
+    )
+    yd = algorithm.get_yd()
+    assert algorithm.get_yd() is yd
+    np.testing.assert_allclose(yd, dataset[:, -1], rtol=1e-5)
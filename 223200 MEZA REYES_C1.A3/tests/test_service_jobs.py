@@ -0,0 +1,81 @@
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pytest
+from service.jobs import run_dataset_job, run_function_job
+
+def write_dataset(path, rows=200, features=3):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(rows, features))
+    y = X @ np.arange(1, features + 1) + 0.5
+    data = np.column_stack((np.arange(rows), X, y))
+    header = ";".join(["id", *[f"X{i}" for i in range(1, features + 1)], "Y"])
+    np.savetxt(path, data, delimiter=";", header=header, comments="")
+    return path
+
+def drain(events):
+    items = []
+    while True:
+        try:
+            items.append(events.get_nowait())
+        except queue.Empty:
+            return items
+
+@pytest.fixture
+def dataset_params(tmp_path):
+    return {
+        "dataset": str(write_dataset(tmp_path / "dataset.csv")),
+        "iterations": 4,
+        "population_size": 12,
+        "crossover_rate": 0.8,
+        "mutation_rate": 0.5,
+        "min_interval_mutation_rate": -0.5,
+        "max_interval_mutation_rate": 0.5,
+        "seed": 3,
+        "num_workers": 1,
+    }
+
+def test_repeated_dataset_job_returns_cached_result(tmp_path, dataset_params):
+    events = queue.Queue()
+    cache_directory = str(tmp_path / "cache")
+
+    first = run_dataset_job("a", dataset_params, events, threading.Event(), cache_directory)
+    first_progress = [event for _, event in drain(events) if event["type"] == "progress"]
+    second = run_dataset_job("b", dataset_params, events, threading.Event(), cache_directory)
+    second_progress = [event for _, event in drain(events) if event["type"] == "progress"]
+
+    assert not first["cached"] and second["cached"]
+    assert len(first_progress) == dataset_params["iterations"] and not second_progress
+    assert second["best_fitness"] == first["best_fitness"]
+    assert second["best_weights"] == first["best_weights"]
+    assert second["generations"] == first["generations"]
+
+def test_dataset_job_without_seed_is_not_cached(tmp_path, dataset_params):
+    params = {**dataset_params, "seed": None}
+    cache_directory = str(tmp_path / "cache")
+    for job_id in ("a", "b"):
+        result = run_dataset_job(job_id, params, queue.Queue(), threading.Event(), cache_directory)
+        assert not result["cached"]
+
+def test_repeated_function_job_returns_cached_result(tmp_path):
+    params = {
+        "delta": 0.01, "min_val": -10, "max_val": 10, "iteration": 5, "pop_max": 40, "pop_min": 20,
+        "crossover_rate": 0.8, "mutation_rate": 0.3, "bit_mutation_rate": 0.3, "seed": 7,
+    }
+    cache_directory = str(tmp_path / "cache")
+    context = multiprocessing.get_context("spawn")
+    with context.Manager() as manager:
+        events = manager.Queue()
+        results = []
+        for job_id in ("a", "b"):
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results.append(executor.submit(
+                    run_function_job, job_id, params, events, manager.Event(), cache_directory
+                ).result(timeout=120))
+    first, second = results
+    assert not first["cached"] and second["cached"]
+    assert second["best_fitness"] == first["best_fitness"]
+    assert second["best_binary"] == first["best_binary"]
+    assert second["generations"] == first["generations"]
@@ -0,0 +1,22 @@
+import threading
+
+class OperationCancelled(Exception):
+    pass
+
+class CancellationToken:
+    def __init__(self, event=None):
+        self._event = threading.Event() if event is None else event
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise OperationCancelled("Operación cancelada")
+
+    def wait(self, timeout=None):
+        return self._event.wait(timeout)
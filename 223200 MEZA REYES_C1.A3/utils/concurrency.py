@@ -0,0 +1,91 @@
+import logging
+import os
+import time
+from contextlib import nullcontext
+
+try:
+    from threadpoolctl import ThreadpoolController
+except ImportError:
+    ThreadpoolController = None
+
+BLAS_ENVIRONMENT_VARIABLES = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+logger = logging.getLogger(__name__)
+_controller = None
+_missing_controller_reported = False
+
+def available_cores():
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+def blas_limit_available():
+    return ThreadpoolController is not None
+
+def limit_blas_environment(num_threads):
+    for name in BLAS_ENVIRONMENT_VARIABLES:
+        os.environ[name] = str(max(1, int(num_threads)))
+
+def blas_thread_limit(num_threads):
+    global _controller, _missing_controller_reported
+    if ThreadpoolController is None:
+        if not _missing_controller_reported:
+            _missing_controller_reported = True
+            logger.warning(
+                "threadpoolctl no está instalado; no se limitarán los hilos de BLAS en este proceso"
+            )
+        return nullcontext()
+    if _controller is None:
+        _controller = ThreadpoolController()
+    return _controller.limit(limits=num_threads, user_api="blas")
+
+def candidate_worker_counts(cores):
+    counts = {cores}
+    count = 1
+    while count < cores:
+        counts.add(count)
+        count *= 2
+    return sorted(counts)
+
+def candidate_batch_sizes(population_size, num_workers):
+    sizes = set()
+    for splits in (1, 2, 4):
+        sizes.add(max(1, -(-population_size // (num_workers * splits))))
+    return sorted(sizes, reverse=True)
+
+class ConcurrencyConfig:
+    def __init__(self, num_workers=None, batch_size=None, blas_threads=None):
+        self.cores = available_cores()
+        self.num_workers = max(1, int(num_workers)) if num_workers else self.cores
+        self.batch_size = max(1, int(batch_size)) if batch_size else None
+        self.blas_threads = (
+            max(1, int(blas_threads)) if blas_threads else max(1, self.cores // self.num_workers)
+        )
+        self.calibration_results = []
+
+    def resolve_batch_size(self, population_size):
+        if self.batch_size:
+            return self.batch_size
+        return max(1, -(-population_size // self.num_workers))
+
+    def blas_limit(self):
+        return blas_thread_limit(self.blas_threads)
+
+    def calibrate(self, evaluate, population_size, worker_options=None, repeats=2):
+        best = None
+        self.calibration_results = []
+        for num_workers in worker_options or candidate_worker_counts(self.cores):
+            blas_threads = max(1, self.cores // num_workers)
+            for batch_size in candidate_batch_sizes(population_size, num_workers):
+                evaluate(num_workers, batch_size, blas_threads)
+                start = time.perf_counter()
+                for _ in range(repeats):
+                    evaluate(num_workers, batch_size, blas_threads)
+                elapsed = max(time.perf_counter() - start, 1e-9)
+                result = (num_workers, batch_size, blas_threads, repeats * population_size / elapsed)
+                self.calibration_results.append(result)
+                if best is None or result[-1] > best[-1]:
+                    best = result
+
+        self.num_workers, self.batch_size, self.blas_threads, _ = best
+        return best
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+def generate_dataset(rows, features, noise=50.0, outlier_fraction=0.0, outlier_scale=10.0,
+                     feature_range=1000.0, weight_range=5.0, seed=None):
+    if rows <= 0 or features <= 0:
+        raise ValueError("El número de filas y de variables debe ser mayor que 0")
+    if not 0 <= outlier_fraction <= 1:
+        raise ValueError("La fracción de valores atípicos debe estar entre 0 y 1")
+
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(-feature_range, feature_range, size=(rows, features))
+    weights = rng.uniform(-weight_range, weight_range, size=features + 1)
+    y = weights[0] + X @ weights[1:] + rng.normal(0, noise, size=rows)
+
+    num_outliers = int(round(outlier_fraction * rows))
+    if num_outliers > 0:
+        outliers = rng.choice(rows, size=num_outliers, replace=False)
+        signs = rng.choice((-1.0, 1.0), size=num_outliers)
+        y[outliers] += signs * outlier_scale * y.std()
+
+    return X, y, weights
+
+def to_dataframe(X, y):
+    data = {"id": np.arange(1, len(y) + 1)}
+    data.update({f"X{i + 1}": X[:, i] for i in range(X.shape[1])})
+    data["Y"] = y
+    return pd.DataFrame(data)
+
+def write_dataset(path, X, y, decimals=2):
+    to_dataframe(np.round(X, decimals), np.round(y, decimals)).to_csv(path, sep=";", index=False)
@@ -0,0 +1,53 @@
+import numpy as np
+
+def minmax_downsample(y, num_points):
+    y = np.asarray(y)
+    num_rows = len(y)
+    if num_points <= 0 or num_rows <= num_points:
+        return np.arange(num_rows)
+
+    num_buckets = max(1, num_points // 2)
+    bucket_size = -(-num_rows // num_buckets)
+    padded = np.pad(y, (0, num_buckets * bucket_size - num_rows), mode="edge")
+    buckets = padded.reshape(num_buckets, bucket_size)
+    offsets = np.arange(num_buckets) * bucket_size
+
+    indices = np.concatenate((
+        [0, num_rows - 1],
+        offsets + buckets.argmin(axis=1),
+        offsets + buckets.argmax(axis=1),
+    ))
+    return np.unique(np.minimum(indices, num_rows - 1))
+
+def lttb_downsample(y, num_points):
+    y = np.asarray(y)
+    num_rows = len(y)
+    if num_points < 3 or num_rows <= num_points:
+        return np.arange(num_rows)
+
+    edges = np.linspace(1, num_rows - 1, num_points - 1).astype(int)
+    indices = np.empty(num_points, dtype=int)
+    indices[0] = 0
+    indices[-1] = num_rows - 1
+    anchor = 0
+    for bucket in range(num_points - 2):
+        start, end = edges[bucket], max(edges[bucket + 1], edges[bucket] + 1)
+        next_start = end
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else num_rows
+        next_end = max(next_end, next_start + 1)
+        average_x = (next_start + next_end - 1) / 2
+        average_y = y[next_start:next_end].mean()
+
+        candidates = np.arange(start, end)
+        areas = np.abs(
+            (anchor - average_x) * (y[candidates] - y[anchor])
+            - (anchor - candidates) * (average_y - y[anchor])
+        )
+        anchor = start + int(areas.argmax())
+        indices[bucket + 1] = anchor
+    return indices
+
+DOWNSAMPLERS = {
+    "minmax": minmax_downsample,
+    "lttb": lttb_downsample,
+}
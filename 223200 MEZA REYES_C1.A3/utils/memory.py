@@ -0,0 +1,114 @@
+import os
+import threading
+import tracemalloc
+import numpy as np
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+def current_rss():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+class MemoryTracker:
+    def __init__(self, interval=10, top=10, trace=True, frames=1):
+        self.interval = max(1, int(interval))
+        self.top = top
+        self.trace = trace
+        self.frames = frames
+        self.samples = []
+        self.top_allocations = []
+        self.baseline = None
+        self.started_tracing = False
+        self.lock = threading.Lock()
+
+    def start(self):
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self.started_tracing = True
+        if self.trace:
+            self.baseline = self.take_snapshot()
+
+    def reset(self):
+        with self.lock:
+            self.samples = []
+            self.top_allocations = []
+            self.baseline = None
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+
+    def take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+
+    def sample(self, generation, force=False):
+        if not force and generation % self.interval != 0:
+            return None
+        with self.lock:
+            if self.trace and self.baseline is None:
+                self.start()
+            record = {"generation": generation, "rss_bytes": current_rss()}
+            if self.trace and tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                record["traced_bytes"] = current
+                record["traced_peak_bytes"] = peak
+                statistics = self.take_snapshot().compare_to(self.baseline, "lineno")
+                self.top_allocations = [
+                    {
+                        "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                        "size_bytes": stat.size_diff,
+                        "count": stat.count_diff,
+                    }
+                    for stat in statistics[:self.top]
+                ]
+            self.samples.append(record)
+            return record
+
+    def growth_per_generation(self, key=None, warmup=1):
+        key = key or ("traced_bytes" if self.trace else "rss_bytes")
+        points = [
+            (sample["generation"], sample[key])
+            for sample in self.samples[warmup:] if sample.get(key) is not None
+        ]
+        if len(points) < 2:
+            return None
+        generations, memory = np.array(points, dtype=float).T
+        return float(np.polyfit(generations, memory, 1)[0])
+
+    def report(self):
+        with self.lock:
+            return {
+                "samples": list(self.samples),
+                "top_allocations": list(self.top_allocations),
+                "growth_bytes_per_generation": self.growth_per_generation(),
+            }
+
+    def format_report(self):
+        report = self.report()
+        growth = report["growth_bytes_per_generation"]
+        lines = [
+            "Crecimiento de memoria por generación: "
+            + ("---" if growth is None else f"{growth / 1024:.2f} KiB")
+        ]
+        for allocation in report["top_allocations"]:
+            lines.append(
+                f"  {allocation['location']}: {allocation['size_bytes'] / 1024:+.1f} KiB "
+                f"({allocation['count']:+d} bloques)"
+            )
+        return "\n".join(lines)
+
+    def stop(self):
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+        self.baseline = None
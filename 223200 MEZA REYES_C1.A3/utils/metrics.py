@@ -0,0 +1,117 @@
+import threading
+from pathlib import Path
+from queue import Queue
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+METRIC_COLUMNS = ("generation", "best_fitness", "mean_fitness", "worst_fitness", "evaluations", "elapsed")
+
+def resolve_format(path, file_format=None):
+    if file_format is None:
+        file_format = Path(path).suffix.lstrip(".").lower() or "csv"
+    if file_format == "parquet" and pq is None:
+        file_format = "csv"
+    if file_format not in ("csv", "npz", "parquet"):
+        raise ValueError(f"Formato de métricas no soportado: {file_format}")
+    return file_format
+
+class MetricsSink:
+    def __init__(self, path, columns=METRIC_COLUMNS, capacity=256, file_format=None):
+        self.columns = tuple(columns)
+        self.capacity = max(1, int(capacity))
+        self.file_format = resolve_format(path, file_format)
+        self.path = Path(path).with_suffix(f".{self.file_format}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.buffer = np.empty((self.capacity, len(self.columns)))
+        self.size = 0
+        self.rows_written = 0
+        self.chunks = []
+        self.parquet_writer = None
+        self.lock = threading.Lock()
+        self.batches = Queue()
+        self.writer = threading.Thread(target=self.write_batches, daemon=True)
+        self.writer.start()
+        self.closed = False
+
+    def append(self, *values, **named_values):
+        if named_values:
+            values = values + tuple(named_values[column] for column in self.columns[len(values):])
+        with self.lock:
+            if self.closed:
+                raise ValueError(f"El registro de métricas {self.path} ya está cerrado")
+            self.buffer[self.size] = values
+            self.size += 1
+            if self.size == self.capacity:
+                self.flush_buffer()
+
+    def flush_buffer(self):
+        if self.size == 0:
+            return
+        self.batches.put(self.buffer[:self.size])
+        self.buffer = np.empty((self.capacity, len(self.columns)))
+        self.size = 0
+
+    def write_batches(self):
+        while True:
+            batch = self.batches.get()
+            if batch is None:
+                break
+            self.write_batch(batch)
+        self.finish()
+
+    def write_batch(self, batch):
+        if self.file_format == "csv":
+            with open(self.path, "a" if self.rows_written else "w", newline="") as file:
+                header = ";".join(self.columns) if self.rows_written == 0 else ""
+                np.savetxt(file, batch, delimiter=";", header=header, comments="", fmt="%.10g")
+        elif self.file_format == "parquet":
+            table = pa.table({column: batch[:, i] for i, column in enumerate(self.columns)})
+            if self.parquet_writer is None:
+                self.parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self.parquet_writer.write_table(table)
+        else:
+            self.chunks.append(batch)
+        self.rows_written += len(batch)
+
+    def finish(self):
+        if self.file_format == "npz":
+            data = np.concatenate(self.chunks) if self.chunks else np.empty((0, len(self.columns)))
+            np.savez(self.path, **{column: data[:, i] for i, column in enumerate(self.columns)})
+        elif self.parquet_writer is not None:
+            self.parquet_writer.close()
+
+    def flush(self):
+        with self.lock:
+            self.flush_buffer()
+
+    def close(self):
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.flush_buffer()
+            self.batches.put(None)
+        self.writer.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def load_metrics(path):
+    path = Path(path)
+    if path.suffix == ".npz":
+        with np.load(path) as data:
+            return {column: data[column] for column in data.files}
+    if path.suffix == ".parquet":
+        table = pq.read_table(path)
+        return {column: table[column].to_numpy() for column in table.column_names}
+    data = np.genfromtxt(path, delimiter=";", names=True)
+    return {column: data[column] for column in data.dtype.names}
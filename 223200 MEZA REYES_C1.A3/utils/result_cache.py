@@ -0,0 +1,85 @@
+import hashlib
+import json
+import os
+import zipfile
+from enum import Enum
+from pathlib import Path
+import numpy as np
+from utils.checkpoint import write_checkpoint, read_checkpoint
+
+def hash_array(array):
+    array = np.ascontiguousarray(array)
+    digest = hashlib.sha256(f"{array.dtype.str}{array.shape}".encode("utf-8"))
+    digest.update(array.data)
+    return digest.hexdigest()
+
+def canonical(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, np.ndarray):
+        return {"array": hash_array(value)}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {str(key): canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonical(item) for item in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "cache_parameters"):
+        return canonical(value.cache_parameters())
+    raise TypeError(f"No se puede generar una clave de caché para {type(value).__name__}")
+
+def cache_key(**parts):
+    payload = json.dumps(canonical(parts), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ResultCache:
+    def __init__(self, directory=".cache/results", max_bytes=256 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def path(self, key):
+        return self.directory / f"{key}.npz"
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            data = read_checkpoint(path)
+            os.utime(path)
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return None
+        return data
+
+    def put(self, key, arrays):
+        write_checkpoint(self.path(key), arrays)
+        self.evict()
+
+    def entries(self):
+        entries = []
+        for path in self.directory.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -4,6 +4,7 @@ def validate_inputs(params):
         "min_max_interval": params["min_interval_mutation_rate"] < params["max_interval_mutation_rate"],
         "crossover_rate": 0 <= params["crossover_rate"] <= 1,
         "mutation_rate": 0 <= params["mutation_rate"] <= 1,
+        "sample_size": params["sample_size"] > 0,
     }
     
     invalid_fields = [field for field, is_valid in validations.items() if not is_valid]
@@ -13,7 +14,8 @@ def format_validation_error(invalid_fields):
     error_messages = {
         "min_interval_mutation_rate": "El intervalo mínimo de mutación debe ser menor que el máximo.",
         "crossover_rate": "La tasa de cruce debe estar entre 0 y 1.",
-        "mutation_rate": "La tasa de mutación debe estar entre 0 y 1."
+        "mutation_rate": "La tasa de mutación debe estar entre 0 y 1.",
+        "sample_size": "El tamaño de muestra debe ser mayor que 0."
     }
     
     return "\n".join([error_messages[field] for field in invalid_fields])
\ No newline at end of file